@@ -198,14 +198,14 @@ class FPContext(StandardBaseContext):
 
     def hypsum(ctx, p, q, types, coeffs, z, maxterms=6000, **kwargs):
         coeffs = list(coeffs)
-        num = range(p)
-        den = range(p,p+q)
+        num = coeffs[:p]
+        den = coeffs[p:p+q]
         tol = ctx.eps
         s = t = 1.0
         k = 0
         while 1:
-            for i in num: t *= (coeffs[i]+k)
-            for i in den: t /= (coeffs[i]+k)
+            for a in num: t *= (a+k)
+            for b in den: t /= (b+k)
             k += 1; t /= k; t *= z; s += t
             if abs(t) < tol:
                 return s
@@ -53,6 +53,56 @@ else:
 
 from .ctx_mp_python import _mpf, _mpc, mpnumeric
 
+# Number of (argument, precision, rounding) results remembered by each
+# of the slower special functions
+MAX_FUNCTION_CACHE = 1000
+
+def _memoize_libmp(f):
+    """
+    Wrap a raw mpf_ or mpc_ function so that results for recently seen
+    arguments are returned without recomputation. Useful for functions
+    like gamma and zeta that are often evaluated repeatedly at the same
+    few points.
+    """
+    cache = {}
+    def g(x, prec, rnd):
+        key = x, prec, rnd
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        v = f(x, prec, rnd)
+        if len(cache) >= MAX_FUNCTION_CACHE:
+            cache.clear()
+        cache[key] = v
+        return v
+    g.__name__ = f.__name__
+    return g
+
+def _reciprocal_libmp(name, f):
+    """
+    Given a raw mpf_ or mpc_ function f, returns the raw function
+    computing f(1/x), for defining e.g. asec(x) = acos(1/x) directly
+    on the low level. The reciprocal and f are evaluated with a few
+    extra bits, since f may amplify the error of the reciprocal (as
+    atanh does near 0), and the result is rounded at the end.
+    """
+    if name.startswith('mpc_'):
+        def g(z, prec, rnd):
+            re, im = z
+            # Real division also handles infinities
+            if im == fzero:
+                z = libmp.mpf_div(fone, re, prec+10), fzero
+            else:
+                z = libmp.mpc_div(libmp.mpc_one, z, prec+10)
+            return libmp.mpc_pos(f(z, prec+10, rnd), prec, rnd)
+    else:
+        def g(x, prec, rnd):
+            x = libmp.mpf_div(fone, x, prec+10)
+            return libmp.mpf_pos(f(x, prec+10, rnd), prec, rnd)
+    g.__name__ = name
+    return g
+
 class MPContext(BaseMPContext, StandardBaseContext):
     """
     Context for multiprecision arithmetic with a global precision.
@@ -151,26 +201,35 @@ class MPContext(BaseMPContext, StandardBaseContext):
         ctx.frac = ctx._wrap_libmp_function(libmp.mpf_frac, libmp.mpc_frac)
         ctx.fib = ctx.fibonacci = ctx._wrap_libmp_function(libmp.mpf_fibonacci, libmp.mpc_fibonacci)
 
-        ctx.gamma = ctx._wrap_libmp_function(libmp.mpf_gamma, libmp.mpc_gamma)
-        ctx.rgamma = ctx._wrap_libmp_function(libmp.mpf_rgamma, libmp.mpc_rgamma)
-        ctx.loggamma = ctx._wrap_libmp_function(libmp.mpf_loggamma, libmp.mpc_loggamma)
-        ctx.fac = ctx.factorial = ctx._wrap_libmp_function(libmp.mpf_factorial, libmp.mpc_factorial)
+        # Inverse functions of reciprocals
+        for name, base in [('acot', 'atan'), ('asec', 'acos'), ('acsc', 'asin'),
+            ('acoth', 'atanh'), ('asech', 'acosh'), ('acsch', 'asinh')]:
+            setattr(ctx, name, ctx._wrap_libmp_function(
+                _reciprocal_libmp('mpf_'+name, getattr(libmp, 'mpf_'+base)),
+                _reciprocal_libmp('mpc_'+name, getattr(libmp, 'mpc_'+base))))
+
+        # Special functions that are expensive enough to be worth caching
+        memo = _memoize_libmp
+        ctx.gamma = ctx._wrap_libmp_function(memo(libmp.mpf_gamma), memo(libmp.mpc_gamma))
+        ctx.rgamma = ctx._wrap_libmp_function(memo(libmp.mpf_rgamma), memo(libmp.mpc_rgamma))
+        ctx.loggamma = ctx._wrap_libmp_function(memo(libmp.mpf_loggamma), memo(libmp.mpc_loggamma))
+        ctx.fac = ctx.factorial = ctx._wrap_libmp_function(memo(libmp.mpf_factorial), memo(libmp.mpc_factorial))
         ctx.gamma_old = ctx._wrap_libmp_function(libmp.mpf_gamma_old, libmp.mpc_gamma_old)
         ctx.fac_old = ctx.factorial_old = ctx._wrap_libmp_function(libmp.mpf_factorial_old, libmp.mpc_factorial_old)
 
-        ctx.digamma = ctx._wrap_libmp_function(libmp.mpf_psi0, libmp.mpc_psi0)
-        ctx.harmonic = ctx._wrap_libmp_function(libmp.mpf_harmonic, libmp.mpc_harmonic)
-        ctx.ei = ctx._wrap_libmp_function(libmp.mpf_ei, libmp.mpc_ei)
-        ctx.e1 = ctx._wrap_libmp_function(libmp.mpf_e1, libmp.mpc_e1)
-        ctx._ci = ctx._wrap_libmp_function(libmp.mpf_ci, libmp.mpc_ci)
-        ctx._si = ctx._wrap_libmp_function(libmp.mpf_si, libmp.mpc_si)
-        ctx.ellipk = ctx._wrap_libmp_function(libmp.mpf_ellipk, libmp.mpc_ellipk)
-        ctx._ellipe = ctx._wrap_libmp_function(libmp.mpf_ellipe, libmp.mpc_ellipe)
+        ctx.digamma = ctx._wrap_libmp_function(memo(libmp.mpf_psi0), memo(libmp.mpc_psi0))
+        ctx.harmonic = ctx._wrap_libmp_function(memo(libmp.mpf_harmonic), memo(libmp.mpc_harmonic))
+        ctx.ei = ctx._wrap_libmp_function(memo(libmp.mpf_ei), memo(libmp.mpc_ei))
+        ctx.e1 = ctx._wrap_libmp_function(memo(libmp.mpf_e1), memo(libmp.mpc_e1))
+        ctx._ci = ctx._wrap_libmp_function(memo(libmp.mpf_ci), memo(libmp.mpc_ci))
+        ctx._si = ctx._wrap_libmp_function(memo(libmp.mpf_si), memo(libmp.mpc_si))
+        ctx.ellipk = ctx._wrap_libmp_function(memo(libmp.mpf_ellipk), memo(libmp.mpc_ellipk))
+        ctx._ellipe = ctx._wrap_libmp_function(memo(libmp.mpf_ellipe), memo(libmp.mpc_ellipe))
         ctx.agm1 = ctx._wrap_libmp_function(libmp.mpf_agm1, libmp.mpc_agm1)
-        ctx._erf = ctx._wrap_libmp_function(libmp.mpf_erf, None)
-        ctx._erfc = ctx._wrap_libmp_function(libmp.mpf_erfc, None)
-        ctx._zeta = ctx._wrap_libmp_function(libmp.mpf_zeta, libmp.mpc_zeta)
-        ctx._altzeta = ctx._wrap_libmp_function(libmp.mpf_altzeta, libmp.mpc_altzeta)
+        ctx._erf = ctx._wrap_libmp_function(memo(libmp.mpf_erf), None)
+        ctx._erfc = ctx._wrap_libmp_function(memo(libmp.mpf_erfc), None)
+        ctx._zeta = ctx._wrap_libmp_function(memo(libmp.mpf_zeta), memo(libmp.mpc_zeta))
+        ctx._altzeta = ctx._wrap_libmp_function(memo(libmp.mpf_altzeta), memo(libmp.mpc_altzeta))
 
         # Faster versions
         ctx.sqrt = getattr(ctx, "_sage_sqrt", ctx.sqrt)
@@ -182,13 +241,44 @@ class MPContext(BaseMPContext, StandardBaseContext):
     def to_fixed(ctx, x, prec):
         return x.to_fixed(prec)
 
+    def almosteq(ctx, s, t, rel_eps=None, abs_eps=None):
+        t = ctx.convert(t)
+        if not (hasattr(s, '_mpf_') and hasattr(t, '_mpf_')):
+            return StandardBaseContext.almosteq(ctx, s, t, rel_eps, abs_eps)
+        # Fast path for real numbers: work directly with raw mpfs
+        prec, rounding = ctx._prec_rounding
+        if abs_eps is None and rel_eps is None:
+            rel_eps = abs_eps = (0, MPZ_ONE, 4-prec, 1)
+        else:
+            if abs_eps is None:
+                abs_eps = rel_eps
+            elif rel_eps is None:
+                rel_eps = abs_eps
+            abs_eps = ctx.convert(abs_eps)._mpf_
+            rel_eps = ctx.convert(rel_eps)._mpf_
+        sval = s._mpf_
+        tval = t._mpf_
+        diff = mpf_abs(mpf_sub(sval, tval, prec, rounding))
+        if mpf_le(diff, abs_eps):
+            return True
+        abss = mpf_abs(sval, prec, rounding)
+        abst = mpf_abs(tval, prec, rounding)
+        if mpf_lt(abss, abst):
+            err = mpf_div(diff, abst, prec, rounding)
+        else:
+            err = mpf_div(diff, abss, prec, rounding)
+        return mpf_le(err, rel_eps)
+
+    almosteq.__doc__ = StandardBaseContext.almosteq.__doc__
+
     def hypot(ctx, x, y):
         r"""
         Computes the Euclidean norm of the vector `(x, y)`, equal
         to `\sqrt{x^2 + y^2}`. Both `x` and `y` must be real."""
-        x = ctx.convert(x)
-        y = ctx.convert(y)
-        return ctx.make_mpf(libmp.mpf_hypot(x._mpf_, y._mpf_, *ctx._prec_rounding))
+        if type(x) is not ctx.mpf: x = ctx.convert(x)
+        if type(y) is not ctx.mpf: y = ctx.convert(y)
+        prec, rounding = ctx._prec_rounding
+        return ctx.make_mpf(libmp.mpf_hypot(x._mpf_, y._mpf_, prec, rounding))
 
     def _gamma_upper_int(ctx, n, z):
         n = int(ctx._re(n))
@@ -217,16 +307,17 @@ class MPContext(BaseMPContext, StandardBaseContext):
             return ctx.make_mpc((real, imag))
 
     def _nthroot(ctx, x, n):
+        prec, rounding = ctx._prec_rounding
         if hasattr(x, '_mpf_'):
             try:
-                return ctx.make_mpf(libmp.mpf_nthroot(x._mpf_, n, *ctx._prec_rounding))
+                return ctx.make_mpf(libmp.mpf_nthroot(x._mpf_, n, prec, rounding))
             except ComplexResult:
                 if ctx.trap_complex:
                     raise
                 x = (x._mpf_, libmp.fzero)
         else:
             x = x._mpc_
-        return ctx.make_mpc(libmp.mpc_nthroot(x, n, *ctx._prec_rounding))
+        return ctx.make_mpc(libmp.mpc_nthroot(x, n, prec, rounding))
 
     def _besselj(ctx, n, z):
         prec, rounding = ctx._prec_rounding
@@ -256,9 +347,10 @@ class MPContext(BaseMPContext, StandardBaseContext):
         return ctx.make_mpf(libmp.mpf_zeta_int(int(n), *ctx._prec_rounding))
 
     def atan2(ctx, y, x):
-        x = ctx.convert(x)
-        y = ctx.convert(y)
-        return ctx.make_mpf(libmp.mpf_atan2(y._mpf_, x._mpf_, *ctx._prec_rounding))
+        if type(x) is not ctx.mpf: x = ctx.convert(x)
+        if type(y) is not ctx.mpf: y = ctx.convert(y)
+        prec, rounding = ctx._prec_rounding
+        return ctx.make_mpf(libmp.mpf_atan2(y._mpf_, x._mpf_, prec, rounding))
 
     def psi(ctx, m, z):
         z = ctx.convert(z)
@@ -319,13 +411,21 @@ class MPContext(BaseMPContext, StandardBaseContext):
         """
         Determine if *x* is a nonpositive integer.
         """
-        if not x:
-            return True
         if hasattr(x, '_mpf_'):
-            sign, man, exp, bc = x._mpf_
+            v = x._mpf_
+        elif hasattr(x, '_mpc_'):
+            v, im = x._mpc_
+            if im != fzero:
+                return False
+        else:
+            v = None
+        if v is not None:
+            sign, man, exp, bc = v
+            if not man:
+                return v == fzero
             return sign and exp >= 0
-        if hasattr(x, '_mpc_'):
-            return not x.imag and ctx.isnpint(x.real)
+        if not x:
+            return True
         if type(x) in int_types:
             return x <= 0
         if isinstance(x, ctx.mpq):
@@ -349,7 +449,7 @@ class MPContext(BaseMPContext, StandardBaseContext):
 
     @property
     def _str_digits(ctx):
-        return ctx._dps
+        return ctx.dps
 
     def extraprec(ctx, n, normalize_output=False):
         """
@@ -688,7 +788,7 @@ maxterms, or set zeroprec."""
             mpf('0.125')
 
         """
-        x = ctx.convert(x)
+        if type(x) is not ctx.mpf: x = ctx.convert(x)
         return ctx.make_mpf(libmp.mpf_shift(x._mpf_, n))
 
     def frexp(ctx, x):
@@ -703,7 +803,7 @@ maxterms, or set zeroprec."""
             (mpf('0.9375'), 3)
 
         """
-        x = ctx.convert(x)
+        if type(x) is not ctx.mpf: x = ctx.convert(x)
         y, n = libmp.mpf_frexp(x._mpf_)
         return ctx.make_mpf(y), n
 
@@ -1232,12 +1332,13 @@ class PrecisionManager:
         self.normalize_output = normalize_output
     def __call__(self, f):
         def g(*args, **kwargs):
-            orig = self.ctx.prec
+            ctx = self.ctx
+            orig = ctx.prec
             try:
                 if self.precfun:
-                    self.ctx.prec = self.precfun(self.ctx.prec)
+                    ctx.prec = self.precfun(orig)
                 else:
-                    self.ctx.dps = self.dpsfun(self.ctx.dps)
+                    ctx.dps = self.dpsfun(ctx.dps)
                 if self.normalize_output:
                     v = f(*args, **kwargs)
                     if type(v) is tuple:
@@ -1246,14 +1347,14 @@ class PrecisionManager:
                 else:
                     return f(*args, **kwargs)
             finally:
-                self.ctx.prec = orig
+                ctx.prec = orig
         g.__name__ = f.__name__
         g.__doc__ = f.__doc__
         return g
     def __enter__(self):
-        self.origp = self.ctx.prec
+        self.origp = orig = self.ctx.prec
         if self.precfun:
-            self.ctx.prec = self.precfun(self.ctx.prec)
+            self.ctx.prec = self.precfun(orig)
         else:
             self.ctx.dps = self.dpsfun(self.ctx.dps)
     def __exit__(self, exc_type, exc_val, exc_tb):
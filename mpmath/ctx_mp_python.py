@@ -42,13 +42,13 @@ class _mpf(mpnumeric):
     work analogously to Python floats, but support arbitrary-precision
     arithmetic.
     """
-    __slots__ = ['_mpf_']
+    __slots__ = ['_mpf_', '_hash']
 
     def __new__(cls, val=fzero, **kwargs):
         """A new mpf can be created from a Python float, an int, a
         or a decimal string representing a number in floating-point
         format."""
-        prec, rounding = cls.context._prec_rounding
+        prec, rounding = cls._ctxdata[2]
         if kwargs:
             prec = kwargs.get('prec', prec)
             if 'dps' in kwargs:
@@ -102,10 +102,10 @@ class _mpf(mpnumeric):
         if isinstance(x, complex_types): return cls.context.mpc(x)
         if isinstance(x, rational.mpq):
             p, q = x._mpq_
-            return from_rational(p, q, cls.context.prec)
+            return from_rational(p, q, cls._ctxdata[2][0])
         if hasattr(x, '_mpf_'): return x._mpf_
         if hasattr(x, '_mpmath_'):
-            t = cls.context.convert(x._mpmath_(*cls.context._prec_rounding))
+            t = cls.context.convert(x._mpmath_(*cls._ctxdata[2]))
             if hasattr(t, '_mpf_'):
                 return t._mpf_
             return t
@@ -137,7 +137,15 @@ class _mpf(mpnumeric):
         return "mpf('%s')" % to_str(s._mpf_, s.context._repr_digits)
 
     def __str__(s): return to_str(s._mpf_, s.context._str_digits)
-    def __hash__(s): return mpf_hash(s._mpf_)
+
+    def __hash__(s):
+        # The value never changes, so the hash is computed at most once
+        try:
+            return s._hash
+        except AttributeError:
+            h = s._hash = mpf_hash(s._mpf_)
+            return h
+
     def __int__(s): return int(to_int(s._mpf_))
     def __long__(s): return long(to_int(s._mpf_))
     def __float__(s): return to_float(s._mpf_)
@@ -148,14 +156,23 @@ class _mpf(mpnumeric):
 
     def __abs__(s):
         cls, new, (prec, rounding) = s._ctxdata
+        sval = s._mpf_
+        val = mpf_abs(sval, prec, rounding)
+        if val is sval and type(s) is cls:
+            return s
         v = new(cls)
-        v._mpf_ = mpf_abs(s._mpf_, prec, rounding)
+        v._mpf_ = val
         return v
 
     def __pos__(s):
         cls, new, (prec, rounding) = s._ctxdata
+        sval = s._mpf_
+        val = mpf_pos(sval, prec, rounding)
+        # mpf instances are immutable, so no copy is needed
+        if val is sval and type(s) is cls:
+            return s
         v = new(cls)
-        v._mpf_ = mpf_pos(s._mpf_, prec, rounding)
+        v._mpf_ = val
         return v
 
     def __neg__(s):
@@ -335,11 +352,12 @@ class _constant(_mpf):
         a = object.__new__(cls)
         a.name = name
         a.func = func
+        a._cache = (None, None, None)
         a.__doc__ = getattr(function_docs, docname, '')
         return a
 
     def __call__(self, prec=None, dps=None, rounding=None):
-        prec2, rounding2 = self.context._prec_rounding
+        prec2, rounding2 = self._ctxdata[2]
         if not prec: prec = prec2
         if not rounding: rounding = rounding2
         if dps: prec = dps_to_prec(dps)
@@ -347,8 +365,17 @@ class _constant(_mpf):
 
     @property
     def _mpf_(self):
-        prec, rounding = self.context._prec_rounding
-        return self.func(prec, rounding)
+        prec, rounding = self._ctxdata[2]
+        cprec, crounding, cval = self._cache
+        if cprec == prec and crounding == rounding:
+            return cval
+        val = self.func(prec, rounding)
+        self._cache = (prec, rounding, val)
+        return val
+
+    def __hash__(self):
+        # The value depends on the working precision; don't cache
+        return mpf_hash(self._mpf_)
 
     def __repr__(self):
         return "<%s: %s~>" % (self.name, self.context.nstr(self(dps=15)))
@@ -399,12 +426,16 @@ class _mpc(mpnumeric):
 
     def __pos__(s):
         cls, new, (prec, rounding) = s._ctxdata
+        sval = s._mpc_
+        val = mpc_pos(sval, prec, rounding)
+        if val is sval and type(s) is cls:
+            return s
         v = new(cls)
-        v._mpc_ = mpc_pos(s._mpc_, prec, rounding)
+        v._mpc_ = val
         return v
 
     def __abs__(s):
-        prec, rounding = s.context._prec_rounding
+        prec, rounding = s._ctxdata[2]
         v = new(s.context.mpf)
         v._mpf_ = mpc_abs(s._mpc_, prec, rounding)
         return v
@@ -463,9 +494,14 @@ class _mpc(mpnumeric):
     def __add__(s, t):
         cls, new, (prec, rounding) = s._ctxdata
         if not hasattr(t, '_mpc_'):
-            t = s.mpc_convert_lhs(t)
-            if t is NotImplemented:
-                return t
+            if isinstance(t, int_types):
+                v = new(cls)
+                v._mpc_ = mpc_add_mpf(s._mpc_, from_int(t), prec, rounding)
+                return v
+            if not hasattr(t, '_mpf_'):
+                t = s.mpc_convert_lhs(t)
+                if t is NotImplemented:
+                    return t
             if hasattr(t, '_mpf_'):
                 v = new(cls)
                 v._mpc_ = mpc_add_mpf(s._mpc_, t._mpf_, prec, rounding)
@@ -477,9 +513,14 @@ class _mpc(mpnumeric):
     def __sub__(s, t):
         cls, new, (prec, rounding) = s._ctxdata
         if not hasattr(t, '_mpc_'):
-            t = s.mpc_convert_lhs(t)
-            if t is NotImplemented:
-                return t
+            if isinstance(t, int_types):
+                v = new(cls)
+                v._mpc_ = mpc_sub_mpf(s._mpc_, from_int(t), prec, rounding)
+                return v
+            if not hasattr(t, '_mpf_'):
+                t = s.mpc_convert_lhs(t)
+                if t is NotImplemented:
+                    return t
             if hasattr(t, '_mpf_'):
                 v = new(cls)
                 v._mpc_ = mpc_sub_mpf(s._mpc_, t._mpf_, prec, rounding)
@@ -495,14 +536,14 @@ class _mpc(mpnumeric):
                 v = new(cls)
                 v._mpc_ = mpc_mul_int(s._mpc_, t, prec, rounding)
                 return v
-            t = s.mpc_convert_lhs(t)
-            if t is NotImplemented:
-                return t
+            if not hasattr(t, '_mpf_'):
+                t = s.mpc_convert_lhs(t)
+                if t is NotImplemented:
+                    return t
             if hasattr(t, '_mpf_'):
                 v = new(cls)
                 v._mpc_ = mpc_mul_mpf(s._mpc_, t._mpf_, prec, rounding)
                 return v
-            t = s.mpc_convert_lhs(t)
         v = new(cls)
         v._mpc_ = mpc_mul(s._mpc_, t._mpc_, prec, rounding)
         return v
@@ -510,9 +551,14 @@ class _mpc(mpnumeric):
     def __div__(s, t):
         cls, new, (prec, rounding) = s._ctxdata
         if not hasattr(t, '_mpc_'):
-            t = s.mpc_convert_lhs(t)
-            if t is NotImplemented:
-                return t
+            if isinstance(t, int_types):
+                v = new(cls)
+                v._mpc_ = mpc_div_mpf(s._mpc_, from_int(t), prec, rounding)
+                return v
+            if not hasattr(t, '_mpf_'):
+                t = s.mpc_convert_lhs(t)
+                if t is NotImplemented:
+                    return t
             if hasattr(t, '_mpf_'):
                 v = new(cls)
                 v._mpc_ = mpc_div_mpf(s._mpc_, t._mpf_, prec, rounding)
@@ -540,6 +586,11 @@ class _mpc(mpnumeric):
     __radd__ = __add__
 
     def __rsub__(s, t):
+        cls, new, (prec, rounding) = s._ctxdata
+        if isinstance(t, int_types):
+            v = new(cls)
+            v._mpc_ = mpc_sub((from_int(t), fzero), s._mpc_, prec, rounding)
+            return v
         t = s.mpc_convert_lhs(t)
         if t is NotImplemented:
             return t
@@ -557,6 +608,11 @@ class _mpc(mpnumeric):
         return t * s
 
     def __rdiv__(s, t):
+        cls, new, (prec, rounding) = s._ctxdata
+        if isinstance(t, int_types):
+            v = new(cls)
+            v._mpc_ = mpc_mpf_div(from_int(t), s._mpc_, prec, rounding)
+            return v
         t = s.mpc_convert_lhs(t)
         if t is NotImplemented:
             return t
@@ -609,14 +665,22 @@ class PythonMPContext(object):
 
     def _set_prec(ctx, n):
         ctx._prec = ctx._prec_rounding[0] = max(1, int(n))
-        ctx._dps = prec_to_dps(n)
+        # Functions change the precision temporarily all the time, so
+        # the decimal precision is only computed when asked for
+        ctx._dps = None
 
     def _set_dps(ctx, n):
         ctx._prec = ctx._prec_rounding[0] = dps_to_prec(n)
         ctx._dps = max(1, int(n))
 
+    def _get_dps(ctx):
+        dps = ctx._dps
+        if dps is None:
+            dps = ctx._dps = prec_to_dps(ctx._prec)
+        return dps
+
     prec = property(lambda ctx: ctx._prec, _set_prec)
-    dps = property(lambda ctx: ctx._dps, _set_dps)
+    dps = property(_get_dps, _set_dps)
 
     def convert(ctx, x, strings=True):
         """
@@ -979,10 +1043,32 @@ class PythonMPContext(object):
         by raising ComplexResult.
 
         """
+        mpf, mpc = ctx.mpf, ctx.mpc
+        types = ctx.types
+        prec_rounding = ctx._prec_rounding
         def f(x, **kwargs):
-            if type(x) not in ctx.types:
+            t = type(x)
+            if not kwargs:
+                # Fast paths for the most common cases
+                if t is mpf:
+                    prec, rounding = prec_rounding
+                    try:
+                        v = new(mpf)
+                        v._mpf_ = mpf_f(x._mpf_, prec, rounding)
+                        return v
+                    except ComplexResult:
+                        if ctx.trap_complex:
+                            raise
+                        v = new(mpc)
+                        v._mpc_ = mpc_f((x._mpf_, fzero), prec, rounding)
+                        return v
+                if t is mpc:
+                    v = new(mpc)
+                    v._mpc_ = mpc_f(x._mpc_, prec_rounding[0], prec_rounding[1])
+                    return v
+            if t not in types:
                 x = ctx.convert(x)
-            prec, rounding = ctx._prec_rounding
+            prec, rounding = prec_rounding
             if kwargs:
                 prec = kwargs.get('prec', prec)
                 if 'dps' in kwargs:
@@ -990,14 +1076,20 @@ class PythonMPContext(object):
                 rounding = kwargs.get('rounding', rounding)
             if hasattr(x, '_mpf_'):
                 try:
-                    return ctx.make_mpf(mpf_f(x._mpf_, prec, rounding))
+                    v = new(mpf)
+                    v._mpf_ = mpf_f(x._mpf_, prec, rounding)
+                    return v
                 except ComplexResult:
                     # Handle propagation to complex
                     if ctx.trap_complex:
                         raise
-                    return ctx.make_mpc(mpc_f((x._mpf_, fzero), prec, rounding))
+                    v = new(mpc)
+                    v._mpc_ = mpc_f((x._mpf_, fzero), prec, rounding)
+                    return v
             elif hasattr(x, '_mpc_'):
-                return ctx.make_mpc(mpc_f(x._mpc_, prec, rounding))
+                v = new(mpc)
+                v._mpc_ = mpc_f(x._mpc_, prec, rounding)
+                return v
             raise NotImplementedError("%s of a %s" % (name, type(x)))
         name = mpf_f.__name__[4:]
         f.__doc__ = function_docs.__dict__.get(name, "Computes the %s of x" % doc)
@@ -1010,12 +1102,18 @@ class PythonMPContext(object):
             def f_wrapped(ctx, *args, **kwargs):
                 convert = ctx.convert
                 args = [convert(a) for a in args]
-                prec = ctx.prec
+                # Set the precision fields directly rather than through
+                # the prec property; this wrapper runs on every call
+                prec_rounding = ctx._prec_rounding
+                prec = prec_rounding[0]
+                dps = ctx._dps
                 try:
-                    ctx.prec += 10
+                    ctx._prec = prec_rounding[0] = prec + 10
+                    ctx._dps = None
                     retval = f(ctx, *args, **kwargs)
                 finally:
-                    ctx.prec = prec
+                    ctx._prec = prec_rounding[0] = prec
+                    ctx._dps = dps
                 return +retval
         else:
             f_wrapped = f
@@ -1023,6 +1121,8 @@ class PythonMPContext(object):
         setattr(cls, name, f_wrapped)
 
     def _convert_param(ctx, x):
+        if type(x) in int_types:
+            return int(x), 'Z'
         if hasattr(x, "_mpc_"):
             v, im = x._mpc_
             if im != fzero:
@@ -1030,8 +1130,6 @@ class PythonMPContext(object):
         elif hasattr(x, "_mpf_"):
             v = x._mpf_
         else:
-            if type(x) in int_types:
-                return int(x), 'Z'
             p = None
             if isinstance(x, tuple):
                 p, q = x
@@ -1064,7 +1162,8 @@ class PythonMPContext(object):
                 if exp >= -4:
                     p, q = int(man), (1<<(-exp))
                     return ctx.mpq(p,q), 'Q'
-            x = ctx.make_mpf(v)
+            if type(x) is not ctx.mpf:
+                x = ctx.make_mpf(v)
             return x, 'R'
         elif not exp:
             return 0, 'Z'
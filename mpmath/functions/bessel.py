@@ -1,4 +1,4 @@
-from .functions import defun, defun_wrapped
+from .functions import defun, defun_wrapped, c_memo
 
 @defun
 def j0(ctx, x):
@@ -60,6 +60,23 @@ def besselj(ctx, n, z, derivative=0, **kwargs):
                 v = n*z
             else:
                 v = ctx.inf + z + n
+        elif n == 0.5 or n == -0.5:
+            # Elementary closed forms
+            # J_{1/2}(z) = sqrt(2/pi) sqrt(z) sin(z)/z
+            # J_{-1/2}(z) = sqrt(2/pi) cos(z)/sqrt(z)
+            orig = ctx.prec
+            try:
+                ctx.prec += 10
+                if ctx.re(n) > 0:
+                    v = ctx.sin(z)/z
+                else:
+                    v = ctx.cos(z)/z
+                v *= ctx.sqrt(2*z/ctx.pi)
+                # Same type as the general case for a complex-typed order
+                if ctx._is_complex_type(n):
+                    v = ctx.mpc(v)
+            finally:
+                ctx.prec = orig
         else:
             #v = 0
             orig = ctx.prec
@@ -381,20 +398,6 @@ def kei(ctx, n, z, **kwargs):
         return T1, T2, T3, T4
     return ctx.hypercomb(h, [n], **kwargs)
 
-# TODO: do this more generically?
-def c_memo(f):
-    name = f.__name__
-    def f_wrapped(ctx):
-        cache = ctx._misc_const_cache
-        prec = ctx.prec
-        p,v = cache.get(name, (-1,0))
-        if p >= prec:
-            return +v
-        else:
-            cache[name] = (prec, f(ctx))
-            return cache[name][1]
-    return f_wrapped
-
 @c_memo
 def _airyai_C1(ctx):
     return 1 / (ctx.cbrt(9) * ctx.gamma(ctx.mpf(2)/3))
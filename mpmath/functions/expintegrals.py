@@ -1,10 +1,30 @@
-from .functions import defun, defun_wrapped
+from .functions import defun, defun_wrapped, c_memo
+
+@c_memo
+def _two_over_sqrtpi(ctx):
+    return 2/ctx.sqrt(ctx.pi)
+
+@c_memo
+def _sqrt2pi(ctx):
+    return ctx.sqrt(2*ctx.pi)
+
+@c_memo
+def _sqrt2(ctx):
+    return ctx.sqrt(2)
+
+@c_memo
+def _pi_over_6(ctx):
+    return ctx.pi/6
+
+@c_memo
+def _neg_pi2_over_16(ctx):
+    return -ctx.pi**2/16
 
 @defun_wrapped
 def _erf_complex(ctx, z):
     z2 = ctx.square_exp_arg(z, -1)
     #z2 = -z**2
-    v = (2/ctx.sqrt(ctx.pi))*z * ctx.hyp1f1((1,2),(3,2), z2)
+    v = _two_over_sqrtpi(ctx)*z * ctx.hyp1f1((1,2),(3,2), z2)
     if not ctx._re(z):
         v = ctx._im(v)*ctx.j
     return v
@@ -68,7 +88,7 @@ def erfi(ctx, z):
     if not z:
         return z
     z2 = ctx.square_exp_arg(z)
-    v = (2/ctx.sqrt(ctx.pi)*z) * ctx.hyp1f1((1,2), (3,2), z2)
+    v = (_two_over_sqrtpi(ctx)*z) * ctx.hyp1f1((1,2), (3,2), z2)
     if not ctx._re(z):
         v = ctx._im(v)*ctx.j
     return v
@@ -95,15 +115,15 @@ def erfinv(ctx, x):
 @defun_wrapped
 def npdf(ctx, x, mu=0, sigma=1):
     sigma = ctx.convert(sigma)
-    return ctx.exp(-(x-mu)**2/(2*sigma**2)) / (sigma*ctx.sqrt(2*ctx.pi))
+    return ctx.exp(-(x-mu)**2/(2*sigma**2)) / (sigma*_sqrt2pi(ctx))
 
 @defun_wrapped
 def ncdf(ctx, x, mu=0, sigma=1):
-    a = (x-mu)/(sigma*ctx.sqrt(2))
-    if a < 0:
-        return ctx.erfc(-a)/2
-    else:
-        return (1+ctx.erf(a))/2
+    a = (x-mu)/(sigma*_sqrt2(ctx))
+    # erfc(-a) = 1 + erf(a) is accurate for either sign of a: the
+    # lower tail needs no cancellation and the upper tail is evaluated
+    # by erfc as 1 + erf(a) anyway
+    return ctx.erfc(-a)/2
 
 @defun_wrapped
 def betainc(ctx, a, b, x1=0, x2=1, regularized=False):
@@ -309,7 +329,9 @@ def _ei_generic(ctx, z):
             pass
     v = z*ctx.hyp2f2(1,1,2,2,z) + ctx.euler
     if ctx._im(z):
-        v += 0.5*(ctx.log(z) - ctx.log(ctx.one/z))
+        # Off the real axis, log(1/z) = -log(z), so the symmetrized
+        # logarithm 0.5*(log(z) - log(1/z)) is just log(z)
+        v += ctx.log(z)
     else:
         v += ctx.log(abs(z))
     return v
@@ -378,6 +400,10 @@ def _si_generic(ctx, z):
 
 @defun_wrapped
 def chi(ctx, z):
+    # Chi(z) = euler + log(z) + z^2/4 + ...; the correction is
+    # negligible once |z|^2 is below the working precision
+    if z and 2*ctx.mag(z) < -ctx.prec:
+        return ctx.euler + ctx.log(z)
     nz = ctx.fneg(z, exact=True)
     v = 0.5*(ctx.ei(z) + ctx.ei(nz))
     zreal = ctx._re(z)
@@ -393,13 +419,17 @@ def chi(ctx, z):
 @defun_wrapped
 def shi(ctx, z):
     # Suffers from cancellation near 0
-    if ctx.mag(z) >= -1:
+    mag = ctx.mag(z)
+    if mag >= -1:
         nz = ctx.fneg(z, exact=True)
         v = 0.5*(ctx.ei(z) - ctx.ei(nz))
         zimag = ctx._im(z)
         if zimag > 0: v -= 0.5j*ctx.pi
         if zimag < 0: v += 0.5j*ctx.pi
         return v
+    # Shi(z) = z (1 + z^2/18 + ...)
+    elif 2*mag < -ctx.prec:
+        return +z
     else:
         return z * ctx.hyp1f2((1,2),(3,2),(3,2),0.25*z*z)
 
@@ -409,7 +439,12 @@ def fresnels(ctx, z):
         return ctx.mpf(0.5)
     if z == ctx.ninf:
         return ctx.mpf(-0.5)
-    return ctx.pi*z**3/6*ctx.hyp1f2((3,4),(3,2),(7,4),-ctx.pi**2*z**4/16)
+    z2 = z*z
+    # S(z) = pi z^3/6 (1 - pi^2 z^4/56 + ...)
+    if 4*ctx.mag(z) < -ctx.prec:
+        return _pi_over_6(ctx)*(z2*z)
+    w = _neg_pi2_over_16(ctx)*(z2*z2)
+    return _pi_over_6(ctx)*(z2*z)*ctx.hyp1f2((3,4),(3,2),(7,4),w)
 
 @defun_wrapped
 def fresnelc(ctx, z):
@@ -417,4 +452,9 @@ def fresnelc(ctx, z):
         return ctx.mpf(0.5)
     if z == ctx.ninf:
         return ctx.mpf(-0.5)
-    return z*ctx.hyp1f2((1,4),(1,2),(5,4),-ctx.pi**2*z**4/16)
+    # C(z) = z (1 - pi^2 z^4/40 + ...)
+    if 4*ctx.mag(z) < -ctx.prec:
+        return +z
+    z2 = z*z
+    w = _neg_pi2_over_16(ctx)*(z2*z2)
+    return z*ctx.hyp1f2((1,4),(1,2),(5,4),w)
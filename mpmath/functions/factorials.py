@@ -9,8 +9,13 @@ def gammaprod(ctx, a, b, _infsign=False):
     poles_den = []
     regular_num = []
     regular_den = []
-    for x in a: [regular_num, poles_num][ctx.isnpint(x)].append(x)
-    for x in b: [regular_den, poles_den][ctx.isnpint(x)].append(x)
+    isnpint = ctx.isnpint
+    for x in a:
+        if isnpint(x): poles_num.append(x)
+        else:          regular_num.append(x)
+    for x in b:
+        if isnpint(x): poles_den.append(x)
+        else:          regular_den.append(x)
     # One more pole in numerator or denominator gives 0 or inf
     if len(poles_num) < len(poles_den): return ctx.zero
     if len(poles_num) > len(poles_den):
@@ -31,9 +36,16 @@ def gammaprod(ctx, a, b, _infsign=False):
         while poles_num:
             i = poles_num.pop()
             j = poles_den.pop()
-            p *= (-1)**(i+j) * ctx.gamma(1-j) / ctx.gamma(1-i)
+            # i and j are integers, so (-1)**(i+j) is just a sign
+            if (int(ctx._re(i)) + int(ctx._re(j))) & 1:
+                p = -p
+            p *= ctx.gamma(1-j) / ctx.gamma(1-i)
         for x in regular_num: p *= ctx.gamma(x)
-        for x in regular_den: p /= ctx.gamma(x)
+        # Accumulate the denominator and divide once
+        if regular_den:
+            q = ctx.one
+            for x in regular_den: q *= ctx.gamma(x)
+            p /= q
     finally:
         ctx.prec = orig
     return +p
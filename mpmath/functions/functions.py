@@ -1,4 +1,4 @@
-from ..libmp.backend import xrange
+from ..libmp.backend import xrange, int_types
 
 class SpecialFunctions(object):
     """
@@ -87,6 +87,23 @@ def defun(f):
 def defun_static(f):
     setattr(SpecialFunctions, f.__name__, f)
 
+def c_memo(f):
+    """
+    Decorator for a function computing a constant in terms of the
+    context; the value is remembered at the highest precision seen.
+    """
+    name = f.__name__
+    def f_wrapped(ctx):
+        cache = ctx._misc_const_cache
+        prec = ctx.prec
+        p,v = cache.get(name, (-1,0))
+        if p >= prec:
+            return +v
+        else:
+            cache[name] = (prec, f(ctx))
+            return cache[name][1]
+    return f_wrapped
+
 @defun_wrapped
 def cot(ctx, z): return ctx.one / ctx.tan(z)
 
@@ -125,7 +142,16 @@ def acsch(ctx, z): return ctx.asinh(ctx.one / z)
 
 @defun
 def sign(ctx, x):
-    x = ctx.convert(x)
+    if type(x) is not ctx.mpf:
+        x = ctx.convert(x)
+    if hasattr(x, '_mpf_'):
+        # Read the sign bit directly; zero and nan are returned as-is
+        s, man, exp, bc = x._mpf_
+        if man or ctx.isinf(x):
+            if s:
+                return -ctx.one
+            return ctx.one
+        return x
     if not x or ctx.isnan(x):
         return x
     if ctx._is_real_type(x):
@@ -286,7 +312,22 @@ def log(ctx, x, b=None):
     if b is None:
         return ctx.ln(x)
     wp = ctx.prec + 20
-    return ctx.ln(x, prec=wp) / ctx.ln(b, prec=wp)
+    # The same few bases tend to be used repeatedly; remember log(b)
+    # for each of them at the highest precision seen so far
+    if hasattr(b, '_mpf_'):
+        key = b._mpf_
+    elif isinstance(b, int_types):
+        key = b
+    else:
+        return ctx.ln(x, prec=wp) / ctx.ln(b, prec=wp)
+    cache = ctx._misc_const_cache.setdefault('log_base', {})
+    bprec, lnb = cache.get(key, (-1, None))
+    if bprec < wp:
+        lnb = ctx.ln(b, prec=wp)
+        if len(cache) > 100:
+            cache.clear()
+        cache[key] = (wp, lnb)
+    return ctx.ln(x, prec=wp) / lnb
 
 @defun
 def log10(ctx, x):
@@ -398,7 +439,7 @@ def _lambertw_series(ctx, z, k, tol):
         if magz < 1 and abs(z+0.36787944117144) < 0.05:
             if k == 0 or (k == -1 and ctx._im(z) >= 0) or \
                          (k == 1  and ctx._im(z) < 0):
-                delta = ctx.sum_accurately(lambda: [z, ctx.exp(-1)])
+                delta = ctx.sum_accurately(lambda: [z, 1/ctx.e])
                 cancellation = -ctx.mag(delta)
                 ctx.prec += cancellation
                 # Use series given in Corless et al.
@@ -447,26 +488,33 @@ def lambertw(ctx, z, k=0):
     if not ctx.isnormal(z):
         return _lambertw_special(ctx, z, k)
     prec = ctx.prec
-    ctx.prec += 20 + ctx.mag(k or 1)
-    wp = ctx.prec
-    tol = wp - 5
-    w, done = _lambertw_series(ctx, z, k, tol)
-    if not done:
-        # Use Halley iteration to solve w*exp(w) = z
-        two = ctx.mpf(2)
-        for i in xrange(100):
-            ew = ctx.exp(w)
-            wew = w*ew
-            wewz = wew-z
-            wn = w - wewz/(wew+ew-(w+two)*wewz/(two*w+two))
-            if ctx.mag(wn-w) <= ctx.mag(wn) - tol:
-                w = wn
-                break
-            else:
-                w = wn
-        if i == 100:
-            ctx.warn("Lambert W iteration failed to converge for z = %s" % z)
-    ctx.prec = prec
+    try:
+        ctx.prec += 20 + ctx.mag(k or 1)
+        wp = ctx.prec
+        tol = wp - 5
+        w, done = _lambertw_series(ctx, z, k, tol)
+        if not done:
+            # Use Halley iteration to solve w*exp(w) = z
+            two = ctx.mpf(2)
+            # Halley's method converges cubically: once the correction is
+            # below a third of the tolerance, the next step would only
+            # change bits beyond it, so it can be skipped
+            tol3 = tol//3 + 10
+            for i in xrange(100):
+                ew = ctx.exp(w)
+                wew = w*ew
+                wewz = wew-z
+                wn = w - wewz/(wew+ew-(w+two)*wewz/(two*w+two))
+                if ctx.mag(wn-w) <= ctx.mag(wn) - tol3:
+                    w = wn
+                    break
+                else:
+                    w = wn
+            if i == 100:
+                ctx.warn("Lambert W iteration failed to converge "
+                    "for z = %s" % z)
+    finally:
+        ctx.prec = prec
     return +w
 
 @defun_wrapped
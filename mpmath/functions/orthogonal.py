@@ -1,3 +1,4 @@
+from ..libmp.backend import xrange
 from .functions import defun, defun_wrapped
 
 def _hermite_param(ctx, n, z, parabolic_cylinder):
@@ -57,6 +58,56 @@ def _hermite_param(ctx, n, z, parabolic_cylinder):
             terms[i][1].append(1)
     return tuple(terms)
 
+def _orthopoly_recurrence(ctx, kind, n, x):
+    """
+    Evaluates the Chebyshev polynomial T_n(x) (kind 0), U_n(x) (kind 1)
+    or the Legendre polynomial P_n(x) (kind 2) for integer n >= 0 and
+    real 0 < |x| <= 1 using the three-term recurrence in n, in
+    fixed-point arithmetic. Returns None if the recurrence does not
+    apply or if the result may have lost accuracy through cancellation;
+    the caller then falls back to the hypergeometric series.
+    """
+    if not (hasattr(x, '_mpf_') and ctx.isint(n) and ctx._is_real_type(n)):
+        return None
+    n = int(n)
+    if n < 0 or n > 2000 or not ctx.isnormal(x):
+        return None
+    xf = float(x)
+    # Close to x = 1 the hypergeometric series in (1-x)/2 converges
+    # after far fewer than n terms
+    if abs(xf) > 1 or n*(1-xf) < 1:
+        return None
+    # All P_k are bounded by n+1 on [-1,1] and rounding errors grow at
+    # most quadratically in n, so the absolute error is below
+    # 2^(-prec-20-extra); the result is only accepted if it is not too
+    # small compared to that. Near x = 0, P_n(x) is of order x for
+    # odd n, which the extra bits account for.
+    extra = max(0, -ctx.mag(x))
+    wp = ctx.prec + 3*ctx.mag(n) + 20 + extra
+    tol = -10 - extra
+    for attempt in range(2):
+        X = ctx.to_fixed(x, wp)
+        p0 = 1 << wp
+        if kind == 1:
+            p1 = 2*X
+        else:
+            p1 = X
+        if kind == 2:
+            for k in xrange(1, n):
+                p0, p1 = p1, ((2*k+1)*((X*p1) >> wp) - k*p0) // (k+1)
+        else:
+            wp1 = wp - 1
+            for k in xrange(1, n):
+                p0, p1 = p1, ((X*p1) >> wp1) - p0
+        mag = ctx.mag(p1) - wp
+        if mag >= tol:
+            return ctx.ldexp(p1, -wp)
+        if attempt or not p1:
+            return None
+        extra = tol - mag + 10
+        wp += extra
+        tol -= extra
+
 @defun
 def hermite(ctx, n, z, **kwargs):
     return ctx.hypercomb(lambda: _hermite_param(ctx, n, z, 0), [], **kwargs)
@@ -349,6 +400,9 @@ def laguerre(ctx, n, a, z, **kwargs):
 
 @defun_wrapped
 def legendre(ctx, n, x, **kwargs):
+    y = _orthopoly_recurrence(ctx, 2, n, x)
+    if y is not None:
+        return y
     if ctx.isint(n):
         n = int(n)
         # Accuracy near zeros
@@ -441,12 +495,18 @@ def legenq(ctx, n, m, z, type=2, **kwargs):
 
 @defun_wrapped
 def chebyt(ctx, n, x, **kwargs):
+    y = _orthopoly_recurrence(ctx, 0, n, x)
+    if y is not None:
+        return y
     if (not x) and ctx.isint(n) and int(ctx._re(n)) % 2 == 1:
         return x * 0
     return ctx.hyp2f1(-n,n,(1,2),(1-x)/2, **kwargs)
 
 @defun_wrapped
 def chebyu(ctx, n, x, **kwargs):
+    y = _orthopoly_recurrence(ctx, 1, n, x)
+    if y is not None:
+        return y
     if (not x) and ctx.isint(n) and int(ctx._re(n)) % 2 == 1:
         return x * 0
     return (n+1) * ctx.hyp2f1(-n, n+2, (3,2), (1-x)/2, **kwargs)
@@ -677,6 +677,13 @@ def _hurwitz_em(ctx, s, a, d, prec, verbose):
     if ctx.isint(s):
         s = int(ctx._re(s))
     s1 = s-1
+    # The coefficients -B(2j)/(2j)! do not depend on s or a; share
+    # them between calls at the same precision
+    cache = ctx._misc_const_cache
+    em_prec, em_coeffs = cache.get('hurwitz_em', (None, None))
+    if em_prec != ctx.prec:
+        em_coeffs = []
+        cache['hurwitz_em'] = (ctx.prec, em_coeffs)
     while 1:
         # Truncated L-series
         l = ctx._zetasum(s, M1+a, M2-M1-1, [d])[0][0]
@@ -716,7 +723,9 @@ def _hurwitz_em(ctx, s, a, d, prec, verbose):
                 for i in xrange(1,D+1): Un[i] += (d-(i-1))*U[i-1]
                 U = Un
                 r *= rM2a
-            t = ctx.fdot(U, logs) * r * ctx.bernoulli(j2)/(-fact)
+            if j > len(em_coeffs):
+                em_coeffs.append(ctx.bernoulli(j2)/(-fact))
+            t = ctx.fdot(U, logs) * r * em_coeffs[j-1]
             tailsum += t
             if ctx.mag(t) < tol:
                 return lsum, (-1)**d * tailsum
@@ -475,7 +475,7 @@ def mpf_bernoulli(n, prec, rnd=None):
 
 def mpf_bernoulli_huge(n, prec, rnd=None):
     wp = prec + 10
-    piprec = wp + int(math.log(n,2))
+    piprec = wp + bitcount(n)
     v = mpf_gamma_int(n+1, wp)
     v = mpf_mul(v, mpf_zeta_int(n, wp), wp)
     v = mpf_mul(v, mpf_pow_int(mpf_pi(piprec), -n, wp))
@@ -564,7 +564,7 @@ def bernfrac(n):
     for k in list_primes(n+1):
         if not (n % (k-1)):
             q *= k
-    prec = bernoulli_size(n) + int(math.log(q,2)) + 20
+    prec = bernoulli_size(n) + bitcount(q) + 20
     b = mpf_bernoulli(n, prec)
     p = mpf_mul(b, from_int(q))
     pint = to_int(p, round_nearest)
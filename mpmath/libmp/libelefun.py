@@ -540,15 +540,14 @@ def agm_fixed(a, b, prec):
     Fixed-point computation of agm(a,b), assuming
     a, b both close to unit magnitude.
     """
-    i = 0
+    # The arithmetic mean exceeds the limit by at most (a-b)^2/(8a),
+    # so once a and b agree to half the precision it is accurate
+    # and the final square root can be skipped
+    half = MPZ_ONE << max(0, (prec>>1)-6)
     while 1:
-        anew = (a+b)>>1
-        if i > 4 and abs(a-anew) < 8:
-            return a
-        b = isqrt_fast(a*b)
-        a = anew
-        i += 1
-    return a
+        if abs(a-b) < half:
+            return (a+b)>>1
+        a, b = (a+b)>>1, isqrt_fast(a*b)
 
 def log_agm(x, prec):
     """
@@ -891,20 +890,25 @@ def mpf_atan2(y, x, prec, rnd=round_fast):
             # -pi/2
             return mpf_neg(mpf_shift(mpf_pi(prec, negative_rnd[rnd]), -1))
         return fnan
-    if ysign:
-        return mpf_neg(mpf_atan2(mpf_neg(y), x, prec, negative_rnd[rnd]))
+    # The quadrant is decided from the signs alone; the result has
+    # the sign of y, so for negative y the pi multiples are negated
+    # (with the rounding direction reversed)
     if not xman:
         if x == fnan:
             return fnan
         if x == finf:
             return fzero
+        if ysign:
+            p = mpf_neg(mpf_pi(prec, negative_rnd[rnd]))
+        else:
+            p = mpf_pi(prec, rnd)
         if x == fninf:
-            return mpf_pi(prec, rnd)
-        if y == fzero:
-            return fzero
-        return mpf_shift(mpf_pi(prec, rnd), -1)
+            return p
+        return mpf_shift(p, -1)
     tquo = mpf_atan(mpf_div(y, x, prec+4), prec+4)
     if xsign:
+        if ysign:
+            return mpf_sub(tquo, mpf_pi(prec+4), prec, rnd)
         return mpf_add(mpf_pi(prec+4), tquo, prec, rnd)
     else:
         return mpf_pos(tquo, prec, rnd)
@@ -934,6 +938,60 @@ def mpf_acos(x, prec, rnd=round_fast):
     c = mpf_div(b, mpf_add(fone, x, wp), wp)
     return mpf_shift(mpf_atan(c, prec, rnd), 1)
 
+# Leading coefficients of x*(1 + c_1 x^2 + c_2 x^4 + ...) as fractions
+# (p1, q1, p2, q2), used when x is small enough that the x^6 term vanishes
+SHORT_SERIES_ASINH = (-1, 6, 3, 40)
+SHORT_SERIES_ATANH = (1, 3, 1, 5)
+SHORT_SERIES_TANH = (-1, 3, 2, 15)
+
+def short_odd_series(x, prec, rnd, coeffs):
+    """
+    Compute x*(1 + c_1 x^2 + c_2 x^4) in Horner form for x with
+    6*mag(x) < -(prec+20), where the remaining terms of the series
+    (all with coefficients smaller than 1) are negligible.
+    """
+    sign, man, exp, bc = x
+    p1, q1, p2, q2 = coeffs
+    wp = prec + 20
+    offset = 2*exp + wp
+    x2 = man*man
+    if offset >= 0:
+        x2 <<= offset
+    else:
+        x2 >>= (-offset)
+    t = (p1 << wp)//q1 + (p2*x2)//q2
+    s = (MPZ_ONE << wp) + ((x2*t) >> wp)
+    return mpf_mul(x, from_man_exp(s, -wp), prec, rnd)
+
+def asinh_atanh_series(x, prec, rnd, asinh):
+    """
+    Compute asinh(x) (or atanh(x), if asinh is false) for small x
+    as x*(1 + c_1 x^2 + c_2 x^4 + ...), evaluating the bracketed
+    factor in fixed-point arithmetic.
+    """
+    sign, man, exp, bc = x
+    wp = prec + 20
+    if 6*(exp+bc) < -wp:
+        if asinh:
+            return short_odd_series(x, prec, rnd, SHORT_SERIES_ASINH)
+        return short_odd_series(x, prec, rnd, SHORT_SERIES_ATANH)
+    offset = 2*exp + wp
+    x2 = man*man
+    if offset >= 0:
+        x2 <<= offset
+    else:
+        x2 >>= (-offset)
+    s = p = MPZ_ONE << wp
+    k = 1
+    while p:
+        if asinh:
+            p = -((p*x2 >> wp) * (2*k-1)) // (2*k)
+        else:
+            p = (p*x2) >> wp
+        s += p // (2*k+1)
+        k += 1
+    return mpf_mul(x, from_man_exp(s, -wp), prec, rnd)
+
 def mpf_asinh(x, prec, rnd=round_fast):
     wp = prec + 20
     sign, man, exp, bc = x
@@ -941,6 +999,9 @@ def mpf_asinh(x, prec, rnd=round_fast):
     if mag < -8:
         if mag < -wp:
             return mpf_perturb(x, 1-sign, prec, rnd)
+        # The series needs about wp/(-2*mag) terms
+        if wp < -200*mag:
+            return asinh_atanh_series(x, prec, rnd, 1)
         wp += (-mag)
     # asinh(x) = log(x+sqrt(x**2+1))
     # use reflection symmetry to avoid cancellation
@@ -975,6 +1036,8 @@ def mpf_atanh(x, prec, rnd=round_fast):
     if mag < -8:
         if mag < -wp:
             return mpf_perturb(x, sign, prec, rnd)
+        if wp < -200*mag:
+            return asinh_atanh_series(x, prec, rnd, 0)
         wp += (-mag)
     a = mpf_add(x, fone, wp)
     b = mpf_sub(fone, x, wp)
@@ -1383,7 +1446,13 @@ def mpf_cos_pi(x, prec, rnd=round_fast): return mpf_cos_sin(x, prec, rnd, 1, 1)
 def mpf_sin_pi(x, prec, rnd=round_fast): return mpf_cos_sin(x, prec, rnd, 2, 1)
 def mpf_cosh(x, prec, rnd=round_fast): return mpf_cosh_sinh(x, prec, rnd)[0]
 def mpf_sinh(x, prec, rnd=round_fast): return mpf_cosh_sinh(x, prec, rnd)[1]
-def mpf_tanh(x, prec, rnd=round_fast): return mpf_cosh_sinh(x, prec, rnd, tanh=1)
+def mpf_tanh(x, prec, rnd=round_fast):
+    sign, man, exp, bc = x
+    if man:
+        mag = exp+bc
+        if -prec-14 <= mag and 6*mag < -prec-20:
+            return short_odd_series(x, prec, rnd, SHORT_SERIES_TANH)
+    return mpf_cosh_sinh(x, prec, rnd, tanh=1)
 
 
 # Low-overhead fixed-point versions
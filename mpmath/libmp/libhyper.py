@@ -783,9 +783,10 @@ def mpf_ci_si(x, prec, rnd=round_fast, which=2):
             if x == fninf:
                 si = mpf_neg(mpf_shift(mpf_pi(prec, negative_rnd[rnd]), -1))
         return (ci, si)
-    # For small x: Ci(x) ~ euler + log(x), Si(x) ~ x
+    # For small x: Ci(x) ~ euler + log(x), Si(x) ~ x; the next
+    # terms are -x^2/4 and -x^3/18
     mag = exp+bc
-    if mag < -wp:
+    if 2*mag < -wp:
         if which != 0:
             si = mpf_perturb(x, 1-sign, prec, rnd)
         if which != 1:
@@ -11,6 +11,7 @@ from bisect import bisect
 
 from .backend import xrange
 from .backend import BACKEND, gmpy, sage, sage_utils, MPZ, MPZ_ONE, MPZ_ZERO
+from .backend import python3
 
 def giant_steps(start, target, n=2):
     """
@@ -110,6 +111,10 @@ elif BACKEND == 'sage':
 else:
     bitcount = python_bitcount
     trailing = python_trailing
+    # On Python 3 all integers are of type int, and int.bit_length
+    # computes the bit size in a single C call
+    if python3:
+        bitcount = int.bit_length
 
 if BACKEND == 'gmpy' and 'bit_length' in dir(gmpy):
     bitcount = gmpy.bit_length
@@ -120,6 +125,56 @@ bctable = [bitcount(n) for n in range(1024)]
 
 # TODO: speed up for bases 2, 4, 8, 16, ...
 
+# Python's builtin multiplication uses Karatsuba's algorithm at best;
+# above this size (in bits), splitting into thirds is faster
+MUL_TOOM3_CUTOFF = 400000
+
+def mul_toom3_python(a, b):
+    """
+    Multiply the nonnegative integers a and b using Toom-Cook 3-way
+    splitting, recursively for large operands. The splitting only pays
+    off when both operands are large; otherwise a*b is used.
+    """
+    abc = bitcount(a)
+    bbc = bitcount(b)
+    if min(abc, bbc) < MUL_TOOM3_CUTOFF:
+        return a*b
+    # Unbalanced operands: multiply b by pieces of a of the same size
+    if abc < bbc:
+        a, b, abc, bbc = b, a, bbc, abc
+    if abc > 2*bbc:
+        mask = (MPZ_ONE<<bbc) - 1
+        r = MPZ_ZERO
+        shift = 0
+        while a:
+            r += mul_toom3_python(a & mask, b) << shift
+            a >>= bbc
+            shift += bbc
+        return r
+    k = (abc+2)//3
+    mask = (MPZ_ONE<<k) - 1
+    a0 = a & mask; a1 = (a >> k) & mask; a2 = a >> (2*k)
+    b0 = b & mask; b1 = (b >> k) & mask; b2 = b >> (2*k)
+    # Evaluate at 0, 1, -1, 2 and infinity
+    pa = a0 + a2
+    pb = b0 + b2
+    r0 = mul_toom3_python(a0, b0)
+    r1 = mul_toom3_python(pa + a1, pb + b1)
+    am1 = pa - a1
+    bm1 = pb - b1
+    if (am1 < 0) ^ (bm1 < 0):
+        rm1 = -mul_toom3_python(abs(am1), abs(bm1))
+    else:
+        rm1 = mul_toom3_python(abs(am1), abs(bm1))
+    r2 = mul_toom3_python((a2<<2) + (a1<<1) + a0, (b2<<2) + (b1<<1) + b0)
+    rinf = mul_toom3_python(a2, b2)
+    # Interpolate (all divisions are exact)
+    c2 = ((r1 + rm1) >> 1) - r0 - rinf
+    d = (r1 - rm1) >> 1
+    c3 = (((r2 - r0 - (c2<<2) - (rinf<<4)) >> 1) - d) // 3
+    c1 = d - c3
+    return r0 + (c1<<k) + (c2<<(2*k)) + (c3<<(3*k)) + (rinf<<(4*k))
+
 def bin_to_radix(x, xbits, base, bdigits):
     """Changes radix of a fixed-point number; i.e., converts
     x * 2**xbits to floor(x * 10**bdigits)."""
@@ -38,6 +38,14 @@ mpc_half = (fhalf, fzero)
 _infs = (finf, fninf)
 _infs_nan = (finf, fninf, fnan)
 
+# Minimum mantissa size (in bits) for which complex multiplication
+# uses three real multiplications instead of four
+MPC_MUL_GAUSS_CUTOFF = 2500
+
+# Precision above which complex division multiplies by the reciprocal
+# of |w|^2 instead of performing two real divisions
+MPC_DIV_RECIPROCAL_CUTOFF = 3000
+
 def mpc_is_inf(z):
     """Check if either real or imaginary part is infinite"""
     re, im = z
@@ -104,7 +112,11 @@ def mpc_sub_mpf(z, p, prec=0, rnd=round_fast):
 
 def mpc_pos(z, prec, rnd=round_fast):
     a, b = z
-    return mpf_pos(a, prec, rnd), mpf_pos(b, prec, rnd)
+    re = mpf_pos(a, prec, rnd)
+    im = mpf_pos(b, prec, rnd)
+    if re is a and im is b:
+        return z
+    return re, im
 
 def mpc_neg(z, prec=None, rnd=round_fast):
     a, b = z
@@ -154,12 +166,28 @@ def mpc_mul(z, w, prec, rnd=round_fast):
     c, d = w
     p = mpf_mul(a, c)
     q = mpf_mul(b, d)
-    r = mpf_mul(a, d)
-    s = mpf_mul(b, c)
     re = mpf_sub(p, q, prec, rnd)
-    im = mpf_add(r, s, prec, rnd)
+    if _gauss_mul_ok(a, b) and _gauss_mul_ok(c, d):
+        # Gauss' trick: ad+bc = (a+b)(c+d)-ac-bd. All intermediate
+        # operations are exact, so the result is still correctly rounded.
+        t = mpf_mul(mpf_add(a, b), mpf_add(c, d))
+        im = mpf_sub(t, mpf_add(p, q), prec, rnd)
+    else:
+        r = mpf_mul(a, d)
+        s = mpf_mul(b, c)
+        im = mpf_add(r, s, prec, rnd)
     return re, im
 
+def _gauss_mul_ok(a, b):
+    # Both mantissas must be large, and the exact sum a+b must not
+    # be much larger than the terms
+    asign, aman, aexp, abc = a
+    bsign, bman, bexp, bbc = b
+    if abc < MPC_MUL_GAUSS_CUTOFF or bbc < MPC_MUL_GAUSS_CUTOFF:
+        return False
+    size = max(aexp+abc, bexp+bbc) - min(aexp, bexp)
+    return size <= max(abc, bbc) + (min(abc, bbc) >> 2)
+
 def mpc_square(z, prec, rnd=round_fast):
     # (a+b*I)**2 == a**2 - b**2 + 2*I*a*b
     a, b = z
@@ -200,6 +228,11 @@ def mpc_div(z, w, prec, rnd=round_fast):
     # (a*c+b*d)/mag, (b*c-a*d)/mag
     t = mpf_add(mpf_mul(a,c), mpf_mul(b,d), wp)
     u = mpf_sub(mpf_mul(b,c), mpf_mul(a,d), wp)
+    if prec > MPC_DIV_RECIPROCAL_CUTOFF:
+        # Divisions are much slower than multiplications at high
+        # precision, so divide only once
+        m = mpf_div(fone, mag, wp)
+        return mpf_mul(t,m,prec,rnd), mpf_mul(u,m,prec,rnd)
     return mpf_div(t,mag,prec,rnd), mpf_div(u,mag,prec,rnd)
 
 def mpc_div_mpf(z, p, prec, rnd=round_fast):
@@ -233,9 +266,11 @@ def complex_int_pow(a, b, n):
     while n:
         if n & 1:
             wre, wim = wre*a - wim*b, wim*a + wre*b
-            n -= 1
+        n >>= 1
+        # The final squaring would only be thrown away
+        if not n:
+            break
         a, b = a*a - b*b, 2*a*b
-        n //= 2
     return wre, wim
 
 def mpc_pow(z, w, prec, rnd=round_fast):
@@ -290,7 +325,27 @@ def mpc_pow_int(z, n, prec, rnd=round_fast):
         re = from_man_exp(re, int(n*aexp), prec, rnd)
         im = from_man_exp(im, int(n*bexp), prec, rnd)
         return re, im
-    return mpc_exp(mpc_mul_int(mpc_log(z, prec+10), n, prec+10), prec, rnd)
+    nbits = bitcount(n)
+    if nbits < prec // 30:
+        # Binary powering costs one or two multiplications per bit of n,
+        # which at high precision is cheaper than a logarithm and an
+        # exponential
+        wp = prec + 4*nbits + 10
+        r = None
+        while 1:
+            if n & 1:
+                if r is None:
+                    r = z
+                else:
+                    r = mpc_mul(r, z, wp)
+            n >>= 1
+            if not n:
+                break
+            z = mpc_square(z, wp)
+        return mpc_pos(r, prec, rnd)
+    # The error in log(z) is magnified by n
+    wp = prec + nbits + 10
+    return mpc_exp(mpc_mul_int(mpc_log(z, wp), n, wp), prec, rnd)
 
 def mpc_sqrt(z, prec, rnd=round_fast):
     """Complex square root (principal branch).
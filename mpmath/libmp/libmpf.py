@@ -15,12 +15,12 @@ import sys
 getrandbits = None
 
 from .backend import (MPZ, MPZ_TYPE, MPZ_ZERO, MPZ_ONE, MPZ_TWO, MPZ_FIVE,
-    BACKEND, STRICT, HASH_MODULUS, HASH_BITS, gmpy, sage, sage_utils)
+    BACKEND, STRICT, HASH_MODULUS, HASH_BITS, gmpy, sage, sage_utils, xrange)
 
 from .libintmath import (giant_steps,
     trailtable, bctable, lshift, rshift, bitcount, trailing,
     sqrt_fixed, numeral, isqrt, isqrt_fast, sqrtrem,
-    bin_to_radix)
+    bin_to_radix, mul_toom3_python, MUL_TOOM3_CUTOFF)
 
 # We don't pickle tuples directly for the following reasons:
 #   1: pickle uses str() for ints, which is inefficient when they are large
@@ -319,7 +319,8 @@ def from_man_exp(man, exp, prec=None, rnd=round_fast):
         return (sign, man, exp, bc)
     return normalize(sign, man, exp, bc, prec, rnd)
 
-int_cache = dict((n, from_man_exp(n, 0)) for n in range(-10, 257))
+# Small integers occur frequently as operands (x+1, 2*x, x/3, ...)
+int_cache = dict((n, from_man_exp(n, 0)) for n in range(-256, 257))
 
 if BACKEND == 'gmpy' and '_mpmath_create' in dir(gmpy):
     from_man_exp = gmpy._mpmath_create
@@ -331,8 +332,9 @@ def from_int(n, prec=0, rnd=round_fast):
     """Create a raw mpf from an integer. If no precision is specified,
     the mantissa is stored exactly."""
     if not prec:
-        if n in int_cache:
-            return int_cache[n]
+        v = int_cache.get(n)
+        if v:
+            return v
     return from_man_exp(n, 0, prec, rnd)
 
 def to_man_exp(s):
@@ -407,6 +409,10 @@ def mpf_nint(s, prec=0, rnd=round_fast):
 def mpf_frac(s, prec=0, rnd=round_fast):
     return mpf_sub(s, mpf_floor(s), prec, rnd)
 
+# Exact conversions of recently seen floats
+float_cache = {}
+MAX_FLOAT_CACHE = 1000
+
 def from_float(x, prec=53, rnd=round_fast):
     """Create a raw mpf from a Python float, rounding if necessary.
     If prec >= 53, the result is guaranteed to represent exactly the
@@ -414,6 +420,15 @@ def from_float(x, prec=53, rnd=round_fast):
     # frexp only raises an exception for nan on some platforms
     if x != x:
         return fnan
+    if prec >= 53:
+        v = float_cache.get(x)
+        if v:
+            return v
+        v = from_float(x, 0)
+        if len(float_cache) >= MAX_FLOAT_CACHE:
+            float_cache.clear()
+        float_cache[x] = v
+        return v
     # in Python2.5 math.frexp gives an exception for float infinity
     # in Python2.6 it returns (float infinity, 0)
     try:
@@ -567,8 +582,7 @@ def mpf_cmp(s, t):
         return -1
     # Different sides of zero
     if ssign != tsign:
-        if not ssign: return 1
-        return -1
+        return tsign - ssign
     # This reduces to direct integer comparison
     if sexp == texp:
         if sman == tman:
@@ -590,12 +604,18 @@ def mpf_cmp(s, t):
         if a < b: return -1
         if a > b: return 1
 
-    # Both numbers have the same highest bit. Subtract to find
-    # how the lower bits compare.
-    delta = mpf_sub(s, t, 5, round_floor)
-    if delta[0]:
-        return -1
-    return 1
+    # Both numbers have the same highest bit, so the exponents differ
+    # by at most the bit counts; align the mantissas and compare them
+    # as integers.
+    if sexp > texp:
+        sman <<= sexp - texp
+    else:
+        tman <<= texp - sexp
+    if sman == tman:
+        return 0
+    if (sman > tman) ^ ssign:
+        return 1
+    return -1
 
 def mpf_lt(s, t):
     if s == fnan or t == fnan:
@@ -629,7 +649,8 @@ def mpf_pos(s, prec=0, rnd=round_fast):
     precision)."""
     if prec:
         sign, man, exp, bc = s
-        if (not man) and exp:
+        # Also catches zero and special values, which have bc = 0
+        if bc <= prec:
             return s
         return normalize1(sign, man, exp, bc, prec, rnd)
     return s
@@ -644,7 +665,7 @@ def mpf_neg(s, prec=None, rnd=round_fast):
             if s == finf: return fninf
             if s == fninf: return finf
         return s
-    if not prec:
+    if not prec or bc <= prec:
         return (1-sign, man, exp, bc)
     return normalize1(1-sign, man, exp, bc, prec, rnd)
 
@@ -657,7 +678,7 @@ def mpf_abs(s, prec=None, rnd=round_fast):
         if s == fninf:
             return finf
         return s
-    if not prec:
+    if not prec or bc <= prec:
         if sign:
             return (0, man, exp, bc)
         return s
@@ -671,7 +692,7 @@ def mpf_sign(s):
         if s == finf: return 1
         if s == fninf: return -1
         return 0
-    return (-1) ** sign
+    return 1 - 2*sign
 
 def mpf_add(s, t, prec=0, rnd=round_fast, _sub=0):
     """
@@ -693,6 +714,10 @@ def mpf_add(s, t, prec=0, rnd=round_fast, _sub=0):
                 if offset > 100 and prec:
                     delta = sbc + sexp - tbc - texp
                     if delta > prec + 4:
+                        # Exactly representable and the perturbation is
+                        # far below half an ulp
+                        if sbc <= prec and rnd == round_nearest:
+                            return s
                         offset = prec + 4
                         sman <<= offset
                         if tsign == ssign: sman += 1
@@ -718,6 +743,8 @@ def mpf_add(s, t, prec=0, rnd=round_fast, _sub=0):
                 if offset < -100 and prec:
                     delta = tbc + texp - sbc - sexp
                     if delta > prec + 4:
+                        if tbc <= prec and rnd == round_nearest:
+                            return tsign, tman, texp, tbc
                         offset = prec + 4
                         tman <<= offset
                         if ssign == tsign: tman += 1
@@ -855,12 +882,49 @@ def gmpy_mpf_mul_int(s, n, prec, rnd=round_fast):
     man *= n
     return normalize(sign, man, exp, bitcount(man), prec, rnd)
 
+# Multiply by truncated mantissas when both operands exceed the target
+# precision by more than this many bits. If either operand is short, the
+# full product is cheap and truncation does not pay off. Must be at
+# least 32 (the guard bits kept by _mpf_mul_truncated).
+MUL_TRUNCATE_MARGIN = 500
+
+def _mpf_mul_truncated(sign, sman, sexp, sbc, tman, texp, tbc, prec, rnd):
+    """
+    Multiply mantissas that are both much longer than the target
+    precision by first discarding their low bits. The exact product
+    lies strictly between s'*t' and (s'+1)*(t'+1), where s' and t' are
+    the truncated mantissas; if both ends round to the same value,
+    that is the correctly rounded result. Otherwise returns None and
+    the full product must be computed.
+    """
+    wp = prec + 32
+    sshift = sbc - wp
+    tshift = tbc - wp
+    sman >>= sshift
+    tman >>= tshift
+    lo = sman*tman
+    hi = lo + sman + tman + 1
+    exp = sexp + texp + sshift + tshift
+    r = normalize(sign, lo, exp, bitcount(lo), prec, rnd)
+    if r == normalize(sign, hi, exp, bitcount(hi), prec, rnd):
+        return r
+    return None
+
 def python_mpf_mul(s, t, prec=0, rnd=round_fast):
     """Multiply two raw mpfs"""
     ssign, sman, sexp, sbc = s
     tsign, tman, texp, tbc = t
     sign = ssign ^ tsign
-    man = sman*tman
+    if prec and sbc > prec + MUL_TRUNCATE_MARGIN and \
+        tbc > prec + MUL_TRUNCATE_MARGIN:
+        r = _mpf_mul_truncated(sign, sman, sexp, sbc, tman, texp, tbc,
+            prec, rnd)
+        if r:
+            return r
+    if sbc > MUL_TOOM3_CUTOFF and tbc > MUL_TOOM3_CUTOFF:
+        man = mul_toom3_python(sman, tman)
+    else:
+        man = sman*tman
     if man:
         bc = sbc + tbc - 1
         bc += int(man>>bc)
@@ -1013,6 +1077,92 @@ negative_rnd = {
   round_nearest : round_nearest
 }
 
+# Use sliding-window exponentiation in mpf_pow_int for exponents with
+# more bits than POW_WINDOW_CUTOFF when the base has more bits than
+# POW_WINDOW_MIN_BITS. For short bases, multiplying by the base itself
+# is cheaper than by the full-precision table entries.
+POW_WINDOW_CUTOFF = 64
+POW_WINDOW_MIN_BITS = 1000
+POW_WINDOW_SIZE = 4
+
+def _pow_int_window(man, exp, bc, n, nbc, workprec, rounds_down):
+    """
+    Compute man**n * 2**(exp*n) as a mantissa-exponent-bitcount triple
+    truncated to workprec bits (rounding in the direction given by
+    rounds_down), consuming the bits of n in windows of up to
+    POW_WINDOW_SIZE bits. Only odd powers of man up to
+    2**POW_WINDOW_SIZE-1 are multiplied in, so about nbc/5 rather than
+    nbc/2 multiplications are needed besides the squarings.
+    """
+    k = POW_WINDOW_SIZE
+    # Table of odd powers man**(2*j+1)
+    m2 = man*man
+    e2 = exp+exp
+    table = [(man, exp, bc)]
+    tm, te = man, exp
+    for j in xrange((1<<(k-1))-1):
+        tm = tm*m2
+        te += e2
+        tbc = bitcount(tm)
+        if tbc > workprec:
+            if rounds_down:
+                tm = tm >> (tbc-workprec)
+            else:
+                tm = -((-tm) >> (tbc-workprec))
+            te += tbc - workprec
+            tbc = workprec
+        table.append((tm, te, tbc))
+    pm = None
+    i = nbc - 1
+    while i >= 0:
+        if not (n >> i) & 1:
+            pm = pm*pm
+            pe = pe+pe
+            pbc = pbc + pbc - 2
+            pbc = pbc + bctable[int(pm >> pbc)]
+            if pbc > workprec:
+                if rounds_down:
+                    pm = pm >> (pbc-workprec)
+                else:
+                    pm = -((-pm) >> (pbc-workprec))
+                pe += pbc - workprec
+                pbc = workprec
+            i -= 1
+            continue
+        # Longest window of at most k bits ending in a set bit
+        j = max(i-k+1, 0)
+        while not (n >> j) & 1:
+            j += 1
+        tm, te, tbc = table[((n >> j) & ((1<<(i-j+1))-1)) >> 1]
+        if pm is None:
+            pm, pe, pbc = tm, te, tbc
+        else:
+            for r in xrange(i-j+1):
+                pm = pm*pm
+                pe = pe+pe
+                pbc = pbc + pbc - 2
+                pbc = pbc + bctable[int(pm >> pbc)]
+                if pbc > workprec:
+                    if rounds_down:
+                        pm = pm >> (pbc-workprec)
+                    else:
+                        pm = -((-pm) >> (pbc-workprec))
+                    pe += pbc - workprec
+                    pbc = workprec
+            pm = pm*tm
+            pe = pe+te
+            pbc += tbc - 2
+            pbc = pbc + bctable[int(pm >> pbc)]
+            if pbc > workprec:
+                if rounds_down:
+                    pm = pm >> (pbc-workprec)
+                else:
+                    pm = -((-pm) >> (pbc-workprec))
+                pe += pbc - workprec
+                pbc = workprec
+        i = j-1
+    return pm, pe, pbc
+
 def mpf_pow_int(s, n, prec, rnd=round_fast):
     """Compute s**n, where s is a raw mpf and n is a Python integer."""
     sign, man, exp, bc = s
@@ -1031,26 +1181,30 @@ def mpf_pow_int(s, n, prec, rnd=round_fast):
     n = int(n)
     if n == 0: return fone
     if n == 1: return mpf_pos(s, prec, rnd)
+    # Exact powers of two (of either sign) stay exact for any n
+    if man == 1:
+        return (sign & n, MPZ_ONE, exp*n, 1)
     if n == 2:
-        _, man, exp, bc = s
         if not man:
             return fzero
         man = man*man
-        if man == 1:
-            return (0, MPZ_ONE, exp+exp, 1)
         bc = bc + bc - 2
         bc += bctable[int(man>>bc)]
         return normalize1(0, man, exp+exp, bc, prec, rnd)
     if n == -1: return mpf_div(fone, s, prec, rnd)
     if n < 0:
+        # Small powers are computed exactly, leaving a single rounding
+        if bc*n > -200:
+            n = -n
+            man **= n
+            return mpf_div(fone, (sign & n, man, exp*n, bitcount(man)),
+                prec, rnd)
         inverse = mpf_pow_int(s, -n, prec+5, reciprocal_rnd[rnd])
         return mpf_div(fone, inverse, prec, rnd)
 
     result_sign = sign & n
 
     # Use exact integer power when the exact mantissa is small
-    if man == 1:
-        return (result_sign, MPZ_ONE, exp*n, 1)
     if bc*n < 1000:
         man **= n
         return normalize1(result_sign, man, exp*n, bitcount(man), prec, rnd)
@@ -1063,10 +1217,31 @@ def mpf_pow_int(s, n, prec, rnd=round_fast):
     # Now we perform binary exponentiation. Need to estimate precision
     # to avoid rounding errors from temporary operations. Roughly log_2(n)
     # operations are performed.
-    workprec = prec + 4*bitcount(n) + 4
-    _, pm, pe, pbc = fone
-    while 1:
-        if n & 1:
+    nbc = bitcount(n)
+    workprec = prec + 4*nbc + 4
+    if nbc > POW_WINDOW_CUTOFF and bc > POW_WINDOW_MIN_BITS:
+        pm, pe, pbc = _pow_int_window(man, exp, bc, n, nbc, workprec,
+            rounds_down)
+        return normalize(result_sign, pm, pe, pbc, prec, rnd)
+    # Left-to-right: square the partial power for each bit of n below
+    # the leading one and multiply in the base for each set bit. The
+    # base mantissa keeps its original (often small) size, so those
+    # multiplications are cheaper than with right-to-left squaring of
+    # the base.
+    pm, pe, pbc = man, exp, bc
+    for i in xrange(nbc-2, -1, -1):
+        pm = pm*pm
+        pe = pe+pe
+        pbc = pbc + pbc - 2
+        pbc = pbc + bctable[int(pm >> pbc)]
+        if pbc > workprec:
+            if rounds_down:
+                pm = pm >> (pbc-workprec)
+            else:
+                pm = -((-pm) >> (pbc-workprec))
+            pe += pbc - workprec
+            pbc = workprec
+        if (n >> i) & 1:
             pm = pm*man
             pe = pe+exp
             pbc += bc - 2
@@ -1078,21 +1253,6 @@ def mpf_pow_int(s, n, prec, rnd=round_fast):
                     pm = -((-pm) >> (pbc-workprec))
                 pe += pbc - workprec
                 pbc = workprec
-            n -= 1
-            if not n:
-                break
-        man = man*man
-        exp = exp+exp
-        bc = bc + bc - 2
-        bc = bc + bctable[int(man >> bc)]
-        if bc > workprec:
-            if rounds_down:
-                man = man >> (bc-workprec)
-            else:
-                man = -((-man) >> (bc-workprec))
-            exp += bc - workprec
-            bc = workprec
-        n = n // 2
 
     return normalize(result_sign, pm, pe, pbc, prec, rnd)
 
@@ -4,13 +4,23 @@ from .libmp import int_types, mpf_hash, bitcount, from_man_exp, HASH_MODULUS
 
 new = object.__new__
 
+try:
+    from math import gcd as _gcd
+except ImportError:
+    _gcd = None
+
 def create_reduced(p, q, _cache={}):
     key = p, q
     if key in _cache:
         return _cache[key]
-    x, y = p, q
-    while y:
-        x, y = y, x % y
+    if _gcd:
+        x = _gcd(p, q)
+        if q < 0:
+            x = -x
+    else:
+        x, y = p, q
+        while y:
+            x, y = y, x % y
     if x != 1:
         p //= x
         q //= x
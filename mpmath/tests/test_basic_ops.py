@@ -122,6 +122,13 @@ def test_complex_misc():
     assert 1 + mpc(2) == 3
     assert not mpc(2).ae(2 + 1e-13)
     assert mpc(2+1e-15j).ae(2)
+    z = mpc(3, 4)
+    assert z + 2 == 2 + z == mpc(5, 4)
+    assert z - 2 == mpc(1, 4)
+    assert 2 - z == mpc(-1, -4)
+    assert z / 2 == mpc(1.5, 2)
+    assert 25 / z == mpc(3, -4)
+    assert z + 10**30 == mpc(10**30+3, 4)
 
 def test_complex_zeros():
     for a in [0,2]:
@@ -130,6 +137,19 @@ def test_complex_zeros():
           for d in [0,5]:
             assert mpc(a,b)*mpc(c,d) == complex(a,b)*complex(c,d)
 
+def test_complex_mul_high_precision():
+    mp.dps = 2000
+    a, b = sqrt(2), sqrt(3)
+    c, d = sqrt(5), -sqrt(7)
+    z = mpc(a, b) * mpc(c, d)
+    assert z.real == fdot([a, -b], [c, d])
+    assert z.imag == fdot([a, b], [d, c])
+    w = mpc(a, b) / mpc(c, d)
+    assert w.ae(mpc(fdot([a, b], [c, d]), fdot([b, -a], [c, d])) / (c**2+d**2))
+    assert mpc(c, d) / mpc(c, d) == 1
+    assert mpc(6, 4) / mpc(0, 2) == mpc(2, -3)
+    mp.dps = 15
+
 def test_hash():
     for i in range(-256, 256):
         assert hash(mpf(i)) == hash(i)
@@ -150,6 +170,15 @@ def test_hash():
     if sys.version >= "3.2":
         assert hash(mpf(1)*2**2000) == hash(2**2000)
         assert hash(mpf(1)/2**2000) == hash(mpq(1,2**2000))
+    # Repeated hashing gives the same value; constants follow the precision
+    x = mpf(0.25)
+    assert hash(x) == hash(x) == hash(0.25)
+    assert hash(pi) == hash(+pi)
+    mp.dps = 1000
+    try:
+        assert hash(pi) == hash(+pi)
+    finally:
+        mp.dps = 15
 
 # Advanced rounding test
 def test_add_rounding():
@@ -443,3 +472,73 @@ def test_isnan_etc():
     assert mp.isnpint(-1.1+0j) == False
     assert mp.isnpint(-1+0.1j) == False
     assert mp.isnpint(0+0.1j) == False
+    assert mp.isnpint(mp.mpc(-3,0)) == True
+    assert mp.isnpint(mp.mpc(0,0)) == True
+    assert mp.isnpint(mp.mpc(-3,1)) == False
+    assert mp.isnpint(mp.mpc(2,0)) == False
+    assert mp.isnpint(mp.mpc(mp.nan,0)) == False
+
+def test_mpq_reduced():
+    from mpmath.rational import mpq
+    assert mpq(6,4)._mpq_ == (3,2)
+    assert mpq(6,-4)._mpq_ == (-3,2)
+    assert mpq(-6,-4)._mpq_ == (3,2)
+    assert mpq(0,5)._mpq_ == (0,1)
+    assert mpq(3**40*7, 3**38*2)._mpq_ == (63,2)
+    assert (mpq(1,6) + mpq(1,3))._mpq_ == (1,2)
+
+def test_mpf_cmp_same_magnitude():
+    # Numbers with the same leading bit but different exponents
+    a = from_man_exp(5, -3)
+    b = from_man_exp(41, -6)
+    assert mpf_cmp(a, b) == -1 and mpf_cmp(b, a) == 1
+    assert mpf_cmp(mpf_neg(a), mpf_neg(b)) == 1
+    assert mpf_cmp(mpf_neg(b), mpf_neg(a)) == -1
+    assert mpf_cmp(a, (0, 10, -4, 4)) == 0
+    x = mpf('0.1')
+    assert x < x + eps and x + eps > x and -x > -x - eps
+
+def test_mpf_mul_long_operands():
+    # Operands far longer than the target precision
+    a = from_man_exp(3**5001, 0)
+    b = from_man_exp(7**3001, -2000)
+    c = from_man_exp((1<<4000)-1, 0)
+    d = from_int(3**30)
+    for x, y in [(a, b), (a, c), (c, c), (mpf_neg(a), c), (a, d)]:
+        exact = mpf_mul(x, y)
+        for prec in [10, 53, 200]:
+            for rnd in 'nfcdu':
+                assert mpf_mul(x, y, prec, rnd) == \
+                    mpf_pos(exact, prec, rnd)
+
+def test_unary_no_copy():
+    x = mpf(3)
+    assert +x is x
+    z = mpc(2, 3)
+    assert +z is z
+    assert (+z) == z
+    assert +mpc(2**100+1, 3) == mpc(2**100, 3)
+
+def test_mpf_neg_rounding():
+    x = from_int(2**60+1)
+    assert mpf_neg(x, 100) == from_int(-2**60-1)
+    assert mpf_neg(x, 53) == from_int(-2**60)
+    assert mpf_neg(x, 53, round_floor) == from_int(-2**60-2**8)
+    assert mpf_neg(mpf_neg(x, 61), 61) == x
+
+def test_mpf_abs_rounding():
+    x = from_int(-2**60-1)
+    assert mpf_abs(x, 100) == from_int(2**60+1)
+    assert mpf_abs(x, 53) == from_int(2**60)
+    assert mpf_abs(x, 53, round_ceiling) == from_int(2**60+2**8)
+    y = mpf(3)
+    assert abs(y) is y
+
+def test_mpf_add_far_apart():
+    a = from_int(3)
+    b = from_man_exp(5, -300)
+    assert mpf_add(a, b, 53, round_nearest) == a
+    assert mpf_sub(b, a, 53, round_nearest) == mpf_neg(a)
+    assert mpf_add(a, b, 53, round_up) == mpf_add(a, from_man_exp(1, -51))
+    assert mpf_sub(a, b, 53, round_floor) == mpf_sub(a, from_man_exp(1, -51))
+    assert mpf_add(mpf_neg(b), a, 53, round_nearest) == a
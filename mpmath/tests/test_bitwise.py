@@ -170,3 +170,23 @@ def test_long_exponent_shifts():
         assert (d-x) == -x
         assert (e-x) == -x
         assert (f-x) == -x
+
+def test_mul_toom3():
+    from mpmath.libmp.libintmath import mul_toom3_python
+    import random
+    random.seed(1)
+    for bits in [1, 100, 5000, 200000]:
+        a = random.getrandbits(bits)
+        b = random.getrandbits(bits + 37)
+        assert mul_toom3_python(a, b) == a*b
+        assert mul_toom3_python(-a, b) == -a*b
+        assert mul_toom3_python(a, 0) == 0
+    a = MPZ(3)**500000
+    assert mul_toom3_python(a, a-1) == a*(a-1)
+    # Unbalanced operands; products with a small factor
+    b = MPZ(3)**1100000 + 1
+    c = MPZ(5)**180000 - 1
+    assert mul_toom3_python(b, c) == b*c
+    assert mul_toom3_python(c, b) == b*c
+    assert mul_toom3_python(b, a) == b*a
+    assert mul_toom3_python(b, 3) == b*3
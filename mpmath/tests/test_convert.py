@@ -1,4 +1,5 @@
 import random
+import math
 from mpmath import *
 from mpmath.libmp import *
 
@@ -103,6 +104,17 @@ def test_convert_rational():
     assert from_rational(-7, 4, 53, round_nearest) == (1, 7, -2, 3)
     assert to_rational((0, 1, -1, 1)) == (1, 2)
 
+def test_convert_float():
+    for x in [0.1, -0.1, 0.1, 2.5, 1e300, -1e-300, 0.0, -0.0]:
+        m, e = math.frexp(x)
+        v = from_man_exp(int(m*2**53), e-53)
+        assert from_float(x) == from_float(x, 100) == v
+        assert to_float(from_float(x)) == x
+    assert from_float(0.1, 10) == from_man_exp(819, -13)
+    assert from_float(float('nan')) == fnan
+    assert from_float(float('inf')) == finf
+    assert from_float(float('-inf')) == fninf
+
 def test_custom_class():
     class mympf:
         @property
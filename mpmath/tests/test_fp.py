@@ -17,7 +17,7 @@ for test in cases.splitlines():
     argstr = ", ".join(args)
     testline = "%s(%s)" % (fname, argstr)
     ans = str(eval(testline))
-    print "    assert ae(fp.%s, %s)" % (testline, ans)
+    print("    assert ae(fp.%s, %s)" % (testline, ans))
 
 """
 
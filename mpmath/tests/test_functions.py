@@ -61,6 +61,12 @@ def test_constants():
     mp.dps = 15
     assert pi >= -1
     assert pi > 2
+    # cached values must follow the working precision
+    for prec in [100, 15, 100, 30, 15]:
+        mp.dps = prec
+        assert +pi == mpf(tpi)
+        assert pi._mpf_ is pi._mpf_
+    mp.dps = 15
     assert pi > 3
     assert pi < 4
 
@@ -169,6 +175,12 @@ def test_log():
         assert log(x, x) == 1
     assert log(1024, 2) == 10
     assert log(10**1234, 10) == 1234
+    # Alternating bases and precisions (cached log of the base)
+    assert log(8, 2) == 3 and log(100, 10) == 2 and log(8, 2) == 3
+    mp.dps = 50
+    assert log(3, 10).ae(mpf('0.47712125471966243729502790325511530920012886419069'))
+    mp.dps = 15
+    assert log(3, 10).ae(0.47712125471966244)
     assert log(2+2j).ae(cmath.log(2+2j))
     # Accuracy near 1
     assert (log(0.6+0.8j).real*10**17).ae(2.2204460492503131)
@@ -378,6 +390,16 @@ def test_invhyperb_inaccuracy():
     assert (tanh(-1e-10)*10**10).ae(-1)
     assert (atanh(1e-10)*10**10).ae(1)
     assert (atanh(-1e-10)*10**10).ae(-1)
+    # small arguments are handled with a Taylor series
+    for dps in [15, 50, 300]:
+        mp.dps = dps
+        for x in [mpf(3)/1000, -mpf(3)/1000, mpf(2)**-100, -mpf(7)**-20]:
+            a, b, c, tol = asinh(x), atanh(x), tanh(x), 2*eps
+            with extraprec(3*mp.prec):
+                assert a.ae(log(x+sqrt(x**2+1)), tol)
+                assert b.ae(log((1+x)/(1-x))/2, tol)
+                assert c.ae(sinh(x)/cosh(x), tol)
+    mp.dps = 15
 
 def test_complex_functions():
     for x in (list(range(10)) + list(range(-10,0))):
@@ -436,6 +458,28 @@ def test_reciprocal_functions():
     assert asech(0.5).ae(1.31695789692481671)
     assert acsch(3).ae(0.327450150237258443)
     assert acoth(3).ae(0.346573590279972655)
+    # Exactly real complex infinities are inverted to zero
+    assert acot(mpc(inf,0)) == 0 and acot(mpc(-inf,0)) == 0
+    assert asec(mpc(inf,0)) == pi/2 and asec(mpc(-inf,0)) == pi/2
+    assert acsc(mpc(inf,0)) == 0 and acsc(mpc(-inf,0)) == 0
+    assert acoth(mpc(inf,0)) == 0 and acoth(mpc(-inf,0)) == 0
+    assert asech(mpc(inf,0)) == mpc(0,pi/2)
+    assert asech(mpc(-inf,0)) == mpc(0,pi/2)
+    assert acsch(mpc(0,inf)) == 0
+    # Rounded once, at the working precision
+    assert acoth(-0.5).real == mpf('-0.54930614433405485')
+    assert acoth(0.5).real == mpf('0.54930614433405485')
+    assert acoth(1j) == mpc(0,-pi/4)
+    # Tiny arguments, where the real part is much smaller than the result
+    mp.dps = 80
+    x = mpf('2.36786451640709e-42')
+    y = mpc('-1.18638161894383e-41', 1.46238393175919)
+    a = acoth(x).real
+    b = acsch(y).real
+    mp.dps = 50
+    assert abs(acoth(x).real/a - 1) < 1e-15
+    assert abs(acsch(y).real/b - 1) < 1e-15
+    mp.dps = 15
 
 def test_ldexp():
     mp.dps = 15
@@ -20,6 +20,14 @@ def test_bessel():
     assert besselj(-4,2).ae(0.0339957198075684341)
     assert besselj(3,3+2j).ae(0.424718794929639595942 + 0.625665327745785804812j)
     assert besselj(0.25,4).ae(-0.374760630804249715)
+    assert besselj(0.5,3).ae(0.065008182877375778114)
+    assert besselj(-0.5,3).ae(-0.45604882079463317885)
+    assert besselj(0.5,-3).ae(0.065008182877375778114j)
+    assert besselj(-0.5,2-5j).ae(-21.798577263666733352 + 13.257482982875432437j)
+    assert besselj(mpc(0.5,0),3).ae(0.065008182877375778114)
+    assert besselj(mpc(-0.5,0),2j).ae(1.5008989283173478964 - 1.5008989283173478964j)
+    assert type(besselj(mpc(0.5,0),1)) is mpc
+    assert type(besselj(0.5,1)) is mpf
     assert besselj(1+2j,3+4j).ae(0.319247428741872131 - 0.669557748880365678j)
     assert (besselj(3, 10**10) * 10**5).ae(0.76765081748139204023)
     assert bessely(-0.5, 0) == 0
@@ -254,6 +262,11 @@ def test_exp_integrals():
     assert shi(-inf) == -inf
     assert chi(0) == -inf
     assert chi(inf) == inf
+    x = mpf('1e-10')
+    assert si(x).ae(x) and ci(x).ae(-22.448635265038923980)
+    assert shi(x).ae(x) and chi(x).ae(-22.448635265038923980)
+    assert chi(-x).ae(-22.448635265038923980 + pi*j)
+    assert fresnels(x).ae(pi*x**3/6) and fresnelc(x).ae(x)
 
 def test_ei():
     mp.dps = 15
@@ -703,6 +716,11 @@ def test_orthpoly():
     assert legendre(j,-j).ae(2.4448182735671431011 + 0.6928881737669934843j)
     assert chebyu(5,1) == 6
     assert chebyt(3,2) == 26
+    assert chebyt(7,0.25).ae(cos(7*acos(0.25)))
+    assert chebyt(500,-0.75).ae(-0.99647669591682869734)
+    assert chebyu(6,0.3).ae(0.558656)
+    assert legendre(4,0.5).ae(-0.2890625)
+    assert legendre(3,ldexp(1,-200)).ae(-1.5*ldexp(1,-200))
     assert legendre(3.5,-1) == inf
     assert legendre(4.5,-1) == -inf
     assert legendre(3.5+1j,-1) == mpc(inf,inf)
@@ -191,6 +191,19 @@ def test_gamma():
     assert loggamma('1e10000').ae('2.302485092994045684017991e10004')
     assert loggamma('1e10000j').ae(mpc('-1.570796326794896619231322e10000','2.302485092994045684017991e10004'))
 
+def test_gamma_cached():
+    # Repeated evaluation returns results for the current precision
+    mp.dps = 15
+    a = gamma(mpf(1)/3)
+    mp.dps = 30
+    b = gamma(mpf(1)/3)
+    assert b.ae('2.67893853470774763365569294097467764')
+    assert b != a
+    mp.dps = 15
+    assert gamma(mpf(1)/3) == a
+    assert gamma(mpf(1)/3, rounding='u') >= gamma(mpf(1)/3, rounding='d')
+    assert zeta(mpc(2,1)) == zeta(mpc(2,1))
+
 def test_fac2():
     mp.dps = 15
     assert [fac2(n) for n in range(10)] == [1,1,2,3,8,15,48,105,384,945]
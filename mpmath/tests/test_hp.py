@@ -4,7 +4,6 @@ high-precision input, from 5 to 200 digits. The reference values were
 verified with Mathematica.
 """
 
-import time
 from mpmath import *
 
 precs = [5, 15, 28, 35, 57, 80, 100, 150, 200]
@@ -155,51 +154,86 @@ tan_abi_imag = \
 "1446419978852235960862841608081413169601038230073129482874832053357571"\
 "62702259309150715669026865777947502665936317953101462202542168429"
 
-
-def test_hp():
-    for dps in precs:
-        mp.dps = dps + 8
-        aa = mpf(a)
-        bb = mpf(b)
-        a1000 = 1000*mpf(a)
-        abi = mpc(aa, bb)
-        mp.dps = dps
+# The reference strings are parsed only once, at the highest precision
+# used below; ae() compares at the working precision anyway
+with workdps(max(precs) + 8):
+    REFS = {
+        'a' : mpf(a),
+        'b' : mpf(b),
+        'a1000' : 1000*mpf(a),
+        'abi' : mpc(a, b),
+        'sqrt_a' : mpf(sqrt_a),
+        'sqrt_abi' : mpc(sqrt_abi_real, sqrt_abi_imag),
+        'log_a' : mpf(log_a),
+        'log_abi' : mpc(log_abi_real, log_abi_imag),
+        'exp_a' : mpf(exp_a),
+        'exp_abi' : mpc(exp_abi_real, exp_abi_imag),
+        'pow_a_b' : mpf(pow_a_b),
+        'pow_a_abi' : mpc(pow_a_abi_real, pow_a_abi_imag),
+        'pow_abi_abi' : mpc(pow_abi_abi_real, pow_abi_abi_imag),
+        'sin_a' : mpf(sin_a),
+        'sin_1000a' : mpf(sin_1000a),
+        'sin_abi' : mpc(sin_abi_real, sin_abi_imag),
+        'cos_a' : mpf(cos_a),
+        'cos_1000a' : mpf(cos_1000a),
+        'tan_a' : mpf(tan_a),
+        'tan_abi' : mpc(tan_abi_real, tan_abi_imag),
+    }
+
+aa = REFS['a']
+bb = REFS['b']
+abi = REFS['abi']
+
+# (function, arguments, key of the reference value)
+CASES = [
+    (sqrt, (aa,), 'sqrt_a'),
+    (sqrt, (abi,), 'sqrt_abi'),
+    (log, (aa,), 'log_a'),
+    (log, (abi,), 'log_abi'),
+    (exp, (aa,), 'exp_a'),
+    (exp, (abi,), 'exp_abi'),
+    (power, (aa, bb), 'pow_a_b'),
+    (power, (aa, abi), 'pow_a_abi'),
+    (power, (abi, abi), 'pow_abi_abi'),
+    (sin, (a,), 'sin_a'),
+    (sin, (REFS['a1000'],), 'sin_1000a'),
+    (sin, (abi,), 'sin_abi'),
+    (cos, (a,), 'cos_a'),
+    (cos, (REFS['a1000'],), 'cos_1000a'),
+    (tan, (a,), 'tan_a'),
+]
+
+TAN_ABI_EPS = mpf('1e-205')
+
+def check_hp(dps):
+    with workdps(dps):
         assert (sqrt(3) + pi/2).ae(aa)
         assert (e + 1/euler**2).ae(bb)
+        for f, args, key in CASES:
+            assert f(*args).ae(REFS[key]), (f, args, dps)
 
-        assert sqrt(aa).ae(mpf(sqrt_a))
-        assert sqrt(abi).ae(mpc(sqrt_abi_real, sqrt_abi_imag))
-
-        assert log(aa).ae(mpf(log_a))
-        assert log(abi).ae(mpc(log_abi_real, log_abi_imag))
-
-        assert exp(aa).ae(mpf(exp_a))
-        assert exp(abi).ae(mpc(exp_abi_real, exp_abi_imag))
-
-        assert (aa**bb).ae(mpf(pow_a_b))
-        assert (aa**abi).ae(mpc(pow_a_abi_real, pow_a_abi_imag))
-        assert (abi**abi).ae(mpc(pow_abi_abi_real, pow_abi_abi_imag))
-
-        assert sin(a).ae(mpf(sin_a))
-        assert sin(a1000).ae(mpf(sin_1000a))
-        assert sin(abi).ae(mpc(sin_abi_real, sin_abi_imag))
-
-        assert cos(a).ae(mpf(cos_a))
-        assert cos(a1000).ae(mpf(cos_1000a))
-
-        assert tan(a).ae(mpf(tan_a))
-        assert tan(abi).ae(mpc(tan_abi_real, tan_abi_imag))
-
+        t = tan(abi)
+        assert t.ae(REFS['tan_abi'])
         # check that complex cancellation is avoided so that both
         # real and imaginary parts have high relative accuracy.
         # abs_eps should be 0, but has to be set to 1e-205 to pass the
         # 200-digit case, probably due to slight inaccuracy in the
         # precomputed input
-        assert (tan(abi).real).ae(mpf(tan_abi_real), abs_eps=1e-205)
-        assert (tan(abi).imag).ae(mpf(tan_abi_imag), abs_eps=1e-205)
-    mp.dps = 460
-    assert str(log(3))[-20:] == '02166121184001409826'
-    mp.dps = 15
+        assert t.real.ae(+REFS['tan_abi'].real, abs_eps=TAN_ABI_EPS)
+        assert t.imag.ae(+REFS['tan_abi'].imag, abs_eps=TAN_ABI_EPS)
+
+# The precisions are split over two tests so that a failure is easier to
+# locate and the cheap cases don't wait for the expensive ones
+
+def test_hp():
+    for dps in precs[:5]:
+        check_hp(dps)
+
+def test_hp_high():
+    for dps in precs[5:]:
+        check_hp(dps)
+    with workdps(460):
+        assert str(log(3))[-20:] == '02166121184001409826'
 
 # Since str(a) can differ in the last digit from rounded a, and I want
 # to compare the last digits of big numbers with the results in Mathematica,
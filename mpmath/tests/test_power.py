@@ -31,6 +31,40 @@ def test_pow_integer_direction():
             assert to_int(mpf_pow(from_int(a), from_int(b), prec, round_up)) > ab
 
 
+def test_pow_negative_integer_rounding():
+    # Small negative powers are rounded only once
+    random.seed(1234)
+    for prec in [10, 53]:
+        for i in range(50):
+            a = random.randint(3, 1<<prec) | 1
+            b = random.randint(1, 4)
+            for rnd in [round_down, round_up, round_nearest]:
+                assert mpf_pow_int(from_int(a), -b, prec, rnd) == \
+                    from_rational(1, a**b, prec, rnd)
+                assert mpf_pow_int(from_int(-a), -b, prec, rnd) == \
+                    from_rational((-1)**b, a**b, prec, rnd)
+
+def test_pow_power_of_two():
+    # Powers of powers of two are exact for any integer exponent
+    for n in [-1000, -7, -2, -1, 2, 3, 1000]:
+        assert mpf_pow_int(ftwo, n, 10) == (0, 1, n, 1)
+        assert mpf_pow_int(fhalf, n, 10) == (0, 1, -n, 1)
+        assert mpf_pow_int(from_int(-4), n, 10) == (n & 1, 1, 2*n, 1)
+
+def test_pow_int_window():
+    # Long base and exponent, handled by sliding-window exponentiation
+    x = from_man_exp(3**1000, -1585)
+    n = 3**50 + 12345
+    lo = mpf_pow_int(x, n, 1100, round_floor)
+    hi = mpf_pow_int(x, n, 1100, round_ceiling)
+    assert mpf_lt(lo, hi)
+    assert hi == mpf_add(lo, from_man_exp(1, lo[2]))
+    ref = mpf_exp(mpf_mul(mpf_log(x, 1300), from_int(n)), 1200)
+    assert mpf_le(lo, ref) and mpf_le(ref, hi)
+    assert mpf_pow_int(x, n, 1100) in (lo, hi)
+    y = mpf_pow_int(mpf_neg(x), n, 1100, round_floor)
+    assert y == lo
+
 def test_pow_epsilon_rounding():
     """
     Stress test directed rounding for powers with integer exponents.
@@ -153,3 +187,22 @@ def test_pow_epsilon_rounding():
         assert powr(neg09999, -6, r) == 1
 
     mp.dps = 15
+
+def test_complex_int_pow():
+    for a in range(-5, 6):
+        for b in range(-5, 6):
+            re, im = 1, 0
+            for n in range(20):
+                assert complex_int_pow(a, b, n) == (re, im)
+                re, im = re*a - im*b, im*a + re*b
+    assert mpc(1,1)**1000 == mpc(2**500, 0)
+    # Large exponents must not amplify the internal rounding errors
+    for dps in [15, 100]:
+        mp.dps = dps
+        z = mpc(sqrt(2), mpf(1)/3)
+        for n in [10**5, 10**15, 2**100+1, -10**15]:
+            v = z**n
+            with extradps(40):
+                w = z**n
+            assert v.ae(w)
+    mp.dps = 15